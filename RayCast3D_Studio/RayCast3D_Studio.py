@@ -9,6 +9,9 @@ import sys
 import os
 import platform
 import shutil
+import functools
+import contextlib
+import time
 
 # Auto-install missing dependencies
 def _ensure_dependencies():
@@ -18,19 +21,43 @@ def _ensure_dependencies():
         print("Pillow not found. Installing automatically...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow"])
         print("Pillow installed successfully!")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy not found. Installing automatically...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
+        print("NumPy installed successfully!")
 
 _ensure_dependencies()
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog, colorchooser
 from PIL import Image, ImageTk, ImageFont, ImageDraw
+import numpy as np
 import json
+try:
+    import orjson  # Optional: faster project save/load, falls back to json
+except ImportError:
+    orjson = None
+import io
+import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Constants
 MAP_SIZE = 24
 CELL_SIZE = 24  # pixels per cell in the grid display
 LABEL_MARGIN = 20  # pixels reserved for coordinate labels
+MAP_PERIMETER = np.ones((MAP_SIZE, MAP_SIZE), dtype=bool)  # Border cells, which must always hold a wall
+MAP_PERIMETER[1:-1, 1:-1] = False
+MAP_PERIMETER_ROWS = MAP_PERIMETER.tolist()  # Same mask as nested lists, for cheap per-cell lookups
 DEFAULT_TEX_RESOLUTION = 64
+TEXTURE_RESOLUTIONS = (16, 32, 64, 128)  # Sizes offered by the resolution dropdowns
+WALL_PREVIEW_CACHE_SIZE = 8  # Wall previews kept alive for recently selected textures
+
+# Debounced auto-save timing (milliseconds)
+SAVE_DELAY_MS = 250  # Quiet period after the last edit before exporting
+SAVE_MAX_DELAY_MS = 2000  # Longest an edit can wait while edits keep arriving
 
 # Game display constants (for accurate preview)
 GAME_WIDTH = 128
@@ -46,6 +73,7 @@ else:
 
 ASSETS_DIR = os.path.join(SCRIPT_DIR, "../assets")
 PROJECT_FILE = os.path.join(SCRIPT_DIR, "studio_project.json")
+SPRITE_CACHE_FILE = os.path.join(SCRIPT_DIR, "studio_project_sprites.npz")  # Binary sprite pixel sidecar
 
 # Track last-used directory for file dialogs
 _last_file_dir = SCRIPT_DIR
@@ -112,46 +140,280 @@ def _native_open_file_dialog(title="Select File", filetypes=None):
     return path
 
 
-def resize_and_letterbox(img, width, height, bg_color=(0, 0, 0)):
+@functools.lru_cache(maxsize=16)
+def _letterbox_canvas(width, height, bg_color):
+    """Shared blank letterbox canvas for a given size. Callers must paste onto a copy."""
+    return Image.new("RGB", (width, height), bg_color)
+
+
+def project_json_dumps(project):
+    """Serialize the project dict to compact UTF-8 JSON bytes.
+
+    Map grids may be passed as numpy arrays when orjson is available. The output is not
+    indented: indenting puts every map cell on its own line, making the file about five
+    times larger, and it makes the stdlib encoder fall back to its pure-Python path.
+    """
+    if orjson is not None:
+        return orjson.dumps(project, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(project, separators=(',', ':')).encode('utf-8')
+
+
+def project_json_loads(data):
+    """Parse project JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def resize_and_letterbox(img, width, height, bg_color=(0, 0, 0), resample=Image.LANCZOS):
     """Resize image with aspect ratio preserved and letterbox padding."""
     img_copy = img.copy()
-    img_copy.thumbnail((width, height), Image.LANCZOS)
-    canvas = Image.new("RGB", (width, height), bg_color)
+    img_copy.thumbnail((width, height), resample)
+    if img_copy.size == (width, height):
+        # Thumbnail covers the whole frame, so there is no padding to add
+        return img_copy.convert("RGB")
+    canvas = _letterbox_canvas(width, height, tuple(bg_color)).copy()
     x = (width - img_copy.width) // 2
     y = (height - img_copy.height) // 2
     canvas.paste(img_copy, (x, y))
     return canvas
 
 
+def open_source_image(path, resolution=None, crop_bounds=None):
+    """Open and decode a source image, optionally cropped to crop_bounds (source pixels).
+
+    JPEGs are decoded at a reduced DCT scale that still leaves at least 2x the
+    target resolution, so the LANCZOS downscale afterwards has less to do.
+    """
+    img = Image.open(path)
+    full_w, full_h = img.size
+    if resolution and img.format == "JPEG":
+        if crop_bounds is not None:
+            # Only the cropped region has to keep 2x the resolution
+            x1, y1, x2, y2 = crop_bounds
+            region_w, region_h = max(1, x2 - x1), max(1, y2 - y1)
+        else:
+            region_w, region_h = full_w, full_h
+        img.draft(img.mode, (-(-full_w * 2 * resolution // region_w), -(-full_h * 2 * resolution // region_h)))
+    img.load()
+    if crop_bounds is not None:
+        # Crop bounds are stored in full-size source coordinates
+        sx, sy = img.width / full_w, img.height / full_h
+        x1, y1, x2, y2 = crop_bounds
+        img = img.crop((round(x1 * sx), round(y1 * sy), round(x2 * sx), round(y2 * sy)))
+    return img
+
+
+def load_texture_images(path, resolution):
+    """Return (letterboxed texture image, CELL_SIZE map tile) for a texture source file.
+
+    Results are cached per file modification time, so switching a texture back to a
+    resolution it had before (or re-importing the same file) skips decoding and resizing.
+    Callers must not modify the returned images.
+    """
+    return _load_texture_images(os.path.abspath(path), os.stat(path).st_mtime_ns, resolution)
+
+
+def load_source_image(path, resolution, crop_bounds=None):
+    """Return a source image (cropped to crop_bounds) ready to be letterboxed to resolution.
+
+    Non-JPEG sources are decoded once per file modification time and crop, and shared by
+    every resolution; callers must not modify the returned image.
+    """
+    if crop_bounds is not None:
+        crop_bounds = tuple(crop_bounds)
+    img = _decoded_source(os.path.abspath(path), os.stat(path).st_mtime_ns, crop_bounds)
+    if img is None:
+        img = open_source_image(path, resolution, crop_bounds)
+    return img
+
+
+@functools.lru_cache(maxsize=8)
+def _decoded_source(path, mtime_ns, crop_bounds):
+    """Decoded (and cropped) source image shared by every resolution, or None for JPEGs.
+
+    Large sources are box-reduced once to at least 2x the largest texture resolution,
+    so each resolution letterboxes from a small image instead of the full-size file.
+    JPEGs are left to open_source_image, whose reduced-scale decode does the same job.
+    """
+    img = Image.open(path)
+    if img.format == "JPEG":
+        img.close()
+        return None
+    img.load()
+    if crop_bounds is not None:
+        img = img.crop(crop_bounds)
+    factor = min(img.size) // (2 * max(TEXTURE_RESOLUTIONS))
+    if factor > 1 and img.mode in ("RGB", "RGBA", "L", "LA"):
+        img = img.reduce(factor)
+    return img
+
+
+@functools.lru_cache(maxsize=256)  # Room for every resolution of a few dozen textures
+def _load_texture_images(path, mtime_ns, resolution):
+    img = _decoded_source(path, mtime_ns, None)
+    if img is None:
+        img = open_source_image(path, resolution)
+    # Resize to target resolution (this is what goes in-game)
+    processed = resize_and_letterbox(img, resolution, resolution)
+    # Tile preview: scale to cell size with NEAREST
+    tile = processed.resize((CELL_SIZE, CELL_SIZE), Image.NEAREST)
+    return processed, tile
+
+
 def image_to_bgr565_array(img, resolution):
-    """Convert PIL image to BGR565 C array format."""
-    img = resize_and_letterbox(img, resolution, resolution)
-    img = img.convert("RGB")
-    pixels = img.load()
+    """Convert PIL image to a flat uint16 array of BGR565 values (formatted at export)."""
+    # Callers that already letterboxed to the target size skip the second resample
+    if img.size != (resolution, resolution):
+        img = resize_and_letterbox(img, resolution, resolution)
+    return rgb_to_bgr565_array(img)
+
+
+def rgb_to_bgr565(r, g, b):
+    """Pack one 8-bit RGB color into a BGR565 value."""
+    return ((b >> 3) << 11) | ((g >> 2) << 5) | (r >> 3)
+
+
+def rgb_to_bgr565_array(img_rgb):
+    """Convert an RGB PIL image to a flat (row-major) uint16 array of BGR565 values."""
+    if img_rgb.mode != "RGB":
+        img_rgb = img_rgb.convert("RGB")  # convert() copies even when the mode already matches
+    arr = np.asarray(img_rgb)
+    # Shift the 8-bit channels down first, then pack into one uint16 buffer in place
+    bgr565 = (arr[..., 2] >> 3).astype(np.uint16)
+    bgr565 <<= 6
+    bgr565 |= arr[..., 1] >> 2
+    bgr565 <<= 5
+    bgr565 |= arr[..., 0] >> 3
+    return bgr565.ravel()
+
+
+def bgr565_array_to_image(values, resolution):
+    """Expand a flat BGR565 array back to a square RGB PIL image."""
+    flat = np.asarray(values, dtype=np.uint16)
+    if flat.size != resolution * resolution:
+        # Truncate, or pad with black, to the square size
+        padded = np.zeros(resolution * resolution, dtype=np.uint16)
+        padded[:flat.size] = flat[:padded.size]
+        flat = padded
+    rgb = np.take(_bgr565_rgb_table(), flat.reshape(resolution, resolution), axis=0)
+    return Image.fromarray(rgb, "RGB")
+
+
+@functools.lru_cache(maxsize=1)
+def _bgr565_rgb_table():
+    """(65536, 3) uint8 table of the RGB888 expansion (bit replication) of every BGR565 value."""
+    v = np.arange(0x10000, dtype=np.uint16)  # Products stay below 4096, so uint16 is enough
+    # Bit replication as one multiply and shift per channel: (x5 * 33) >> 2 == (x5 << 3) | (x5 >> 2)
+    # and (x6 * 65) >> 4 == (x6 << 2) | (x6 >> 4)
+    return np.stack((((v & 0x1F) * 33) >> 2,
+                     (((v >> 5) & 0x3F) * 65) >> 4,
+                     ((v >> 11) * 33) >> 2), axis=-1).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=1)
+def _hex16_literals():
+    """Table of "0xXXXX" C literals for every 16-bit value, built on first export."""
+    return ["0x%04X" % v for v in range(0x10000)]
+
+
+def hex16_to_array(digits):
+    """Convert hex digit strings (without the 0x prefix) to a uint16 array."""
+    if set(map(len, digits)) <= {4}:
+        # Exported literals are all four digits wide, so decode them in one call (a total
+        # length check alone would accept e.g. 5 + 3 digits and split them wrongly)
+        return np.frombuffer(bytes.fromhex("".join(digits)), dtype=">u2").astype(np.uint16)
+    return np.array([int(d, 16) for d in digits], dtype=np.uint16)
+
+
+# Exported header layout: a "// NAME (RESxRES...)" comment, a "static const uint16_t NAME_data[...] = {"
+# line, rows of hex literals, then a line holding just "};"
+TEXTURE_COMMENT_RE = re.compile(r'^[ \t]*//[ \t]*(\w+)[ \t]*\((\d+)x(\d+)\)', re.MULTILINE)
+SPRITE_COMMENT_RE = re.compile(
+    r'^[ \t]*//[ \t]*(\w+)[ \t]*\((\d+)x(\d+),[ \t]*transparent=0x([0-9A-Fa-f]+)\)', re.MULTILINE)
+DATA_DECL_RE = re.compile(r'^[ \t]*static const uint16_t[^\n]*_data\[[^\n]*$', re.MULTILINE)
+DATA_END_RE = re.compile(r'^[ \t]*\};[ \t]*$', re.MULTILINE)
+HEX_DIGITS_RE = re.compile(r'0x([0-9A-Fa-f]+)', re.IGNORECASE)
+
+
+def scan_header_arrays(text, comment_re):
+    """Yield (comment match, hex digit strings) for each commented data array in an exported header."""
+    for comment in comment_re.finditer(text):
+        decl = DATA_DECL_RE.search(text, comment.end())
+        if decl is None:
+            return
+        end = DATA_END_RE.search(text, decl.end())
+        yield comment, HEX_DIGITS_RE.findall(text, decl.end(), end.start() if end else len(text))
 
-    c_vals = []
-    for y in range(resolution):
-        for x in range(resolution):
-            r, g, b = pixels[x, y]
-            blue5 = b >> 3
-            green6 = g >> 2
-            red5 = r >> 3
-            color = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
-            c_vals.append(f"0x{color:04X}")
 
-    return c_vals
+def write_bgr565_rows(buf, values, row_size):
+    """Write BGR565 values to buf as indented C initializer rows of row_size values."""
+    hex16 = _hex16_literals()
+    values = np.asarray(values).tolist()
+    for i in range(0, len(values), row_size):
+        buf.write("    " + ", ".join([hex16[v] for v in values[i:i+row_size]]) + ",\n")
 
 
 def create_checkerboard(width, height, cell_size=4):
     """Create a checkerboard pattern image for transparency preview."""
-    checker = Image.new("RGB", (width, height))
-    pixels = checker.load()
-    colors = [(180, 180, 180), (220, 220, 220)]  # Light and lighter gray
-    for y in range(height):
-        for x in range(width):
-            color_idx = ((x // cell_size) + (y // cell_size)) % 2
-            pixels[x, y] = colors[color_idx]
-    return checker
+    ys, xs = np.ogrid[:height, :width]
+    mask = ((xs // cell_size) + (ys // cell_size)) & 1
+    colors = np.array([(180, 180, 180), (220, 220, 220)], dtype=np.uint8)  # Light and lighter gray
+    return Image.fromarray(colors[mask], "RGB")
+
+
+@functools.lru_cache(maxsize=8)
+def _sprite_preview_template(width, height):
+    """Fixed parts of a width x height sprite preview: (display size, checkerboard, composite_first).
+
+    The preview is the sprite scaled up (at least 2x, about 128 px tall) over a checkerboard
+    with max(4, scale) px cells. When the cell size is a multiple of the scale, every sprite
+    pixel lies inside one cell, composite_first is True and the checkerboard is returned at
+    sprite resolution; otherwise it is returned at display size.
+    """
+    scale = max(2, 128 // height)
+    cell = max(4, scale)
+    display_size = (width * scale, height * scale)
+    if cell % scale == 0:
+        return display_size, create_checkerboard(width, height, cell // scale), True
+    return display_size, _display_checkerboard(width, height), False
+
+
+@functools.lru_cache(maxsize=8)
+def _display_checkerboard(width, height):
+    """Display-size checkerboard of a width x height sprite preview (see _sprite_preview_template)."""
+    scale = max(2, 128 // height)
+    return create_checkerboard(width * scale, height * scale, max(4, scale))
+
+
+@functools.lru_cache(maxsize=16)
+def brush_disk(radius):
+    """Boolean (2r+1, 2r+1) mask of the pixels a round brush of this radius covers.
+
+    Callers must copy before modifying; the array is shared between calls.
+    """
+    dy, dx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    return dx * dx + dy * dy <= radius * radius
+
+
+def grid_line_cells(start, end):
+    """List the (row, col) cells on a Bresenham line from start to end, inclusive."""
+    (r0, c0), (r1, c1) = start, end
+    dr, dc = abs(r1 - r0), -abs(c1 - c0)
+    step_r = 1 if r0 < r1 else -1
+    step_c = 1 if c0 < c1 else -1
+    err = dr + dc
+    cells = [(r0, c0)]
+    while (r0, c0) != (r1, c1):
+        e2 = 2 * err
+        if e2 >= dc:
+            err += dc
+            r0 += step_r
+        if e2 <= dr:
+            err += dr
+            c0 += step_c
+        cells.append((r0, c0))
+    return cells
 
 
 class Texture:
@@ -160,14 +422,38 @@ class Texture:
         self.name = name
         self.image_path = image_path
         self.resolution = resolution
-        self.c_array = c_array or []
-        self.preview = None  # Tkinter PhotoImage for large preview
+        self.pil_image = None  # Letterboxed PIL image at the texture resolution
+        self.c_array = c_array
+        self.preview = None  # Tkinter PhotoImage for large preview (built lazily)
         self.tile_preview = None  # Tkinter PhotoImage for map grid (CELL_SIZE x CELL_SIZE)
-        self.pil_image = None  # Original PIL image for reprocessing
         self.index = 0  # Texture index in map (1-based, 0 = empty)
 
+    @property
+    def c_array(self):
+        # Converted from pil_image on first use (export), not when the image is loaded
+        if self._c_array is None:
+            if self.pil_image is None:
+                return np.zeros(0, dtype=np.uint16)
+            self._c_array = image_to_bgr565_array(self.pil_image, self.resolution)
+        return self._c_array
+
+    @c_array.setter
+    def c_array(self, value):
+        # None marks the array stale; it is rebuilt from pil_image when next read
+        self._c_array = None if value is None else np.asarray(value, dtype=np.uint16)
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @resolution.setter
+    def resolution(self, value):
+        # Memory size only changes with resolution, so compute it here once
+        self._resolution = value
+        self._memory_bytes = value * value * 2
+
     def memory_bytes(self):
-        return self.resolution * self.resolution * 2
+        return self._memory_bytes
 
     def to_dict(self):
         return {
@@ -187,13 +473,31 @@ class Sprite:
         self.name = name
         self.image_path = image_path
         self.resolution = resolution  # Sprites are always square
-        self.c_array = c_array or []
+        self.c_array = c_array
         self.transparent = transparent  # Auto-detected transparent color (BGR565)
         self.preview = None
         self.crop_bounds = None  # (x1, y1, x2, y2) in original source image pixels, or None
 
+    @property
+    def c_array(self):
+        return self._c_array
+
+    @c_array.setter
+    def c_array(self, value):
+        # Flat uint16 array of BGR565 pixels; hex strings are only produced on export
+        self._c_array = np.asarray(value if value is not None else [], dtype=np.uint16)
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @resolution.setter
+    def resolution(self, value):
+        self._resolution = value
+        self._memory_bytes = value * value * 2
+
     def memory_bytes(self):
-        return self.resolution * self.resolution * 2
+        return self._memory_bytes
 
     def to_dict(self):
         d = {
@@ -226,20 +530,23 @@ class Color:
     """Represents a named color for the game."""
     def __init__(self, name, r, g, b):
         self.name = name
-        self.r = r  # 0-255
-        self.g = g  # 0-255
-        self.b = b  # 0-255
+        self.set_rgb(r, g, b)
+
+    def set_rgb(self, r, g, b):
+        """Set the color channels (0-255) and update the cached BGR565 and hex values."""
+        self.r = r
+        self.g = g
+        self.b = b
+        self._bgr565 = (((b >> 3) & 0x1F) << 11) | (((g >> 2) & 0x3F) << 5) | ((r >> 3) & 0x1F)
+        self._hex = f"#{r:02X}{g:02X}{b:02X}"
 
     def to_bgr565(self):
-        """Convert RGB to BGR565 format."""
-        blue5 = self.b >> 3
-        green6 = self.g >> 2
-        red5 = self.r >> 3
-        return ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
+        """Return the color in BGR565 format."""
+        return self._bgr565
 
     def to_hex_string(self):
         """Return color as #RRGGBB hex string for tkinter."""
-        return f"#{self.r:02X}{self.g:02X}{self.b:02X}"
+        return self._hex
 
     def to_dict(self):
         return {'name': self.name, 'r': self.r, 'g': self.g, 'b': self.b}
@@ -258,6 +565,10 @@ class RayCast3DStudio:
         # Data
         self.textures = []  # List of Texture objects
         self.sprites = []   # List of Sprite objects
+        self._tex_bytes = 0  # Running memory totals, kept in step with the lists above
+        self._sprite_bytes = 0
+        self._memory_totals = None  # Totals last shown by _update_memory_display
+        self._sprite_names = set()  # Names in self.sprites, for O(1) duplicate checks
         self.colors = []    # List of Color objects
 
         # Preserve unloaded entries so saves don't silently drop them
@@ -265,15 +576,38 @@ class RayCast3DStudio:
         self._unloaded_sprites = []
 
         # Multiple maps support
-        self.maps = [{"name": "map1", "data": [[0 for _ in range(MAP_SIZE)] for _ in range(MAP_SIZE)]}]
+        self.maps = [{"name": "map1", "data": np.zeros((MAP_SIZE, MAP_SIZE), dtype=np.uint8)}]
         self.current_map_idx = 0
+        self._map_index_by_name = {"map1": 0}  # Rebuilt by _update_map_selector
 
         self.selected_texture_idx = 1  # 0 = erase, 1+ = texture
         self.is_drawing = False
         self.is_erasing = False  # True when in temporary erase mode (clicked same texture)
-        self.tile_images = {}  # Cache for tile PhotoImages on canvas
+        self.map_cell_ids = []  # Canvas item id per map cell, [row][col]
+        self._map_image_cells = set()  # (row, col) of cells drawn as tile images rather than rectangles
+        self._map_bg_photo = None  # Empty grid (black cells + outlines), drawn as one canvas image
+        self._map_bg_item = None
+        self._map_grid_photo = None  # Interior grid lines on a transparent image, drawn above the cells
+        self._last_painted_cell = None  # (row, col) of the last drag event
+        self._dirty_cells = set()  # Painted cells waiting for the idle-time canvas update
+        self._cell_redraw_pending = False
         self.auto_export_enabled = True  # Auto-export on changes
         self.map_undo_stack = []  # List of (map_idx, data_copy) for undo
+        self._save_job = None  # Pending debounced export + save (root.after id)
+        self._save_requested_at = 0.0  # time.monotonic() of the first edit in the pending burst
+        self._save_last_edit = 0.0  # time.monotonic() of the latest edit in the pending burst
+        self._map_tab_visible = True  # Map redraws are deferred while another tab is shown
+        self._map_dirty = False
+        self._export_contents = {}  # filename -> last header text written to assets/
+        self._export_rows_cache = {}  # filename -> {id(array): (array, resolution, formatted rows)}
+                                      # ("maps.h": {grid bytes: formatted grid})
+        self._assets_dir_ready = False  # assets/ has been created this session
+        self._project_digest = None  # Digest of the last studio_project.json written
+        self._sprite_cache_digest = None  # Digest of the sprite data in the last sidecar written
+        self._io_pool = ThreadPoolExecutor(max_workers=2)  # Image decode/convert off the Tk thread
+        # Header writes get their own worker: _auto_export waits on them, so they must never
+        # queue behind image decodes on _io_pool
+        self._export_pool = ThreadPoolExecutor(max_workers=1)
 
         # Font data: 255 characters, each 5 bytes (column-encoded 5x8 bitmap)
         self.font_data = None  # Will be loaded from font.h or initialized to default
@@ -283,6 +617,7 @@ class RayCast3DStudio:
         self.texture_rows = []  # List of (frame, combo_var) tuples
         self.sprite_rows = []
         self.color_rows = []
+        self.palette_rows = []  # List of (frame, button) tuples in the map tab palette
 
         # Multi-selection support (sets of selected indices)
         self.selected_texture_rows = set()
@@ -294,6 +629,14 @@ class RayCast3DStudio:
         self.last_sprite_click = None
         self.last_color_click = None
 
+        # Rows currently drawn with the selection style (diffed against the selection sets)
+        self._highlighted_texture_rows = set()
+        self._highlighted_color_rows = set()
+        self._highlighted_sprite_rows = set()
+        self._wall_preview_textures = []  # Textures holding a wall preview, least recently shown first
+        self._sprite_selection_pending = False  # Highlight/preview repaint queued with after_idle
+        self._list_layout_deferred = False  # Set by _deferred_list_layout while several lists rebuild
+
         # Initialize perimeter walls for the first map
         self._init_perimeter()
 
@@ -306,10 +649,13 @@ class RayCast3DStudio:
         # Load saved project if exists
         self._load_project()
 
+        self._recount_memory()
+        self._sprite_names = {s.name for s in self.sprites}
         self._update_memory_display()
 
         # Save on window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind('<Destroy>', self._on_root_destroy, add='+')
 
     def _setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts."""
@@ -339,6 +685,50 @@ class RayCast3DStudio:
         # Escape to deselect
         self.root.bind('<Escape>', self._on_escape_key)
 
+    @contextlib.contextmanager
+    def _batched_list_rebuild(self, canvas, window_id):
+        """Hide a scrollable list while its rows are rebuilt, then lay it out once."""
+        canvas.itemconfigure(window_id, state='hidden')
+        try:
+            yield
+        finally:
+            canvas.itemconfigure(window_id, state='normal')
+            if not self._list_layout_deferred:
+                canvas.update_idletasks()
+
+    @contextlib.contextmanager
+    def _deferred_list_layout(self):
+        """Rebuild several lists (see _batched_list_rebuild) with one layout pass at the end."""
+        self._list_layout_deferred = True
+        try:
+            yield
+        finally:
+            self._list_layout_deferred = False
+            self.root.update_idletasks()
+
+    @staticmethod
+    def _sync_row_count(rows, count, create_row):
+        """Grow or shrink a list's rows to count, keeping existing row widgets.
+
+        rows holds one tuple per row (widgets plus any Tk variables); create_row(i) builds row i.
+        """
+        while len(rows) > count:
+            for part in rows.pop():
+                if isinstance(part, tk.Widget):
+                    part.destroy()
+        while len(rows) < count:
+            rows.append(create_row(len(rows)))
+
+    @staticmethod
+    def _add_row_tag(widget, tag):
+        """Route a list row widget's events through the shared class bindings for tag."""
+        widget.bindtags((tag,) + widget.bindtags())
+
+    @staticmethod
+    def _row_of(widget):
+        """Return the list index of a row widget from its grid row."""
+        return int(widget.grid_info()['row'])
+
     def _bind_mousewheel(self, canvas, inner_frame):
         def _on_mousewheel(event):
             if platform.system() == 'Windows':
@@ -375,10 +765,55 @@ class RayCast3DStudio:
         inner_frame.bind("<Enter>", _enter)
         inner_frame.bind("<Leave>", _leave)
 
+    def _schedule_save(self):
+        """Schedule an export + project save, coalescing rapid successive edits.
+
+        Each call restarts the delay, so a burst of edits is written once after it settles.
+        A burst that never settles is still written SAVE_MAX_DELAY_MS after its first edit.
+        Calls during a burst only record the time; the pending timer re-arms itself (see
+        _on_save_timer) instead of being cancelled and rescheduled for every painted cell.
+        """
+        now = time.monotonic()
+        self._save_last_edit = now
+        if self._save_job is None:
+            self._save_requested_at = now
+            self._save_job = self.root.after(SAVE_DELAY_MS, self._on_save_timer)
+
+    def _on_save_timer(self):
+        """Save once edits have paused for SAVE_DELAY_MS, or the burst hit SAVE_MAX_DELAY_MS."""
+        now = time.monotonic()
+        wait_ms = min(SAVE_DELAY_MS - int((now - self._save_last_edit) * 1000),
+                      SAVE_MAX_DELAY_MS - int((now - self._save_requested_at) * 1000))
+        if wait_ms > 0:
+            self._save_job = self.root.after(wait_ms, self._on_save_timer)
+            return
+        self._save_job = None  # This timer has fired; nothing left to cancel
+        self._flush_save()
+
+    def _flush_save(self):
+        """Run a pending export + project save now."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        self._auto_export()
+        self._save_project()
+
+    def _on_root_destroy(self, event):
+        """Flush a pending save if the window is torn down without going through _on_close."""
+        if event.widget is not self.root or self._save_job is None:
+            return
+        self._save_job = None
+        # Export first, as _flush_save does, so the sprite sidecar written by _save_project
+        # ends up newer than images.h and is still used on the next load
+        try:
+            self._auto_export()
+        except tk.TclError:
+            pass  # Status label is already gone; the files were written before it was updated
+        self._save_project()
+
     def _save_and_export(self):
         """Manual save and export."""
-        self._save_project()
-        self._auto_export()
+        self._flush_save()
         self.status_label.config(text="Saved!", foreground='green')
 
     def _on_delete_key(self, event):
@@ -448,8 +883,9 @@ class RayCast3DStudio:
     def _on_close(self):
         """Handle window close - save and export before closing."""
         print("Closing - saving project...")
-        self._save_project()
-        self._auto_export()
+        self._flush_save()
+        self._io_pool.shutdown(wait=False)
+        self._export_pool.shutdown(wait=False)
         self.root.destroy()
 
     @property
@@ -467,14 +903,17 @@ class RayCast3DStudio:
         if map_idx is None:
             map_idx = self.current_map_idx
         data = self.maps[map_idx]["data"]
-        for i in range(MAP_SIZE):
-            data[0][i] = 1       # Top row
-            data[MAP_SIZE-1][i] = 1  # Bottom row
-            data[i][0] = 1       # Left column
-            data[i][MAP_SIZE-1] = 1  # Right column
+        data[0, :] = 1           # Top row
+        data[MAP_SIZE-1, :] = 1  # Bottom row
+        data[:, 0] = 1           # Left column
+        data[:, MAP_SIZE-1] = 1  # Right column
 
     def _build_ui(self):
         """Build the main UI."""
+        # Row highlight style: selection swaps a label's style instead of its colors
+        style = ttk.Style(self.root)
+        style.configure('Selected.TLabel', background='#cce5ff')
+
         # Top row: memory total + status
         top_row = ttk.Frame(self.root)
         top_row.pack(fill='x', padx=10, pady=(5, 0))
@@ -525,6 +964,8 @@ class RayCast3DStudio:
         self.notebook.add(self.font_tab, text='Font (Ctrl+5)')
         self._build_font_tab()
 
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
     def _build_map_tab(self):
         """Build the map editor tab."""
         # Map selection controls at top
@@ -663,8 +1104,7 @@ class RayCast3DStudio:
                 if tex.name == selection:
                     self.maps[self.current_map_idx]["floor_texture"] = i + 1
                     break
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _on_ceil_texture_changed(self, event=None):
         """Handle ceiling texture selection change."""
@@ -676,8 +1116,7 @@ class RayCast3DStudio:
                 if tex.name == selection:
                     self.maps[self.current_map_idx]["ceiling_texture"] = i + 1
                     break
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _build_texture_tab(self):
         """Build the texture manager tab."""
@@ -735,6 +1174,11 @@ class RayCast3DStudio:
         self.texture_canvas_window = self.texture_canvas.create_window((0, 0), window=self.texture_list_frame, anchor='nw')
 
         self.texture_list_frame.bind('<Configure>', lambda e: self.texture_canvas.configure(scrollregion=self.texture_canvas.bbox('all')))
+        # Row clicks are dispatched once through a bind tag shared by all row widgets
+        self.root.bind_class('TextureRow', '<Button-1>',
+                             lambda e: self._select_texture_row(self._row_of(e.widget), e))
+        self.root.bind_class('TextureResCombo', '<<ComboboxSelected>>',
+                             lambda e: self._on_texture_resolution_change(self._row_of(e.widget), e.widget))
         self.texture_canvas.bind('<Configure>', lambda e: self.texture_canvas.itemconfig(self.texture_canvas_window, width=e.width))
 
         # Preview area
@@ -805,6 +1249,8 @@ class RayCast3DStudio:
         self.sprite_canvas_window = self.sprite_canvas.create_window((0, 0), window=self.sprite_list_frame, anchor='nw')
 
         self.sprite_list_frame.bind('<Configure>', lambda e: self.sprite_canvas.configure(scrollregion=self.sprite_canvas.bbox('all')))
+        self.root.bind_class('SpriteRow', '<Button-1>', self._on_sprite_row_click)
+        self.root.bind_class('SpriteResCombo', '<<ComboboxSelected>>', self._on_sprite_res_selected)
         self.sprite_canvas.bind('<Configure>', lambda e: self.sprite_canvas.itemconfig(self.sprite_canvas_window, width=e.width))
 
         # Preview area
@@ -882,6 +1328,10 @@ class RayCast3DStudio:
         self.color_canvas_window = self.color_canvas.create_window((0, 0), window=self.color_list_frame, anchor='nw')
 
         self.color_list_frame.bind('<Configure>', lambda e: self.color_canvas.configure(scrollregion=self.color_canvas.bbox('all')))
+        self.root.bind_class('ColorRow', '<Button-1>',
+                             lambda e: self._select_color_row(self._row_of(e.widget), e))
+        self.root.bind_class('ColorRowEdit', '<Double-Button-1>',
+                             lambda e: self._edit_color_at(self._row_of(e.widget)))
         self.color_canvas.bind('<Configure>', lambda e: self.color_canvas.itemconfig(self.color_canvas_window, width=e.width))
 
         # Color rows tracking
@@ -1222,8 +1672,7 @@ class RayCast3DStudio:
                 char_bytes[col] &= ~(1 << row)
             self._refresh_font_editor()
             self._refresh_font_grid()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
 
     def _on_font_pixel_drag(self, event):
         """Handle drag in the character editor for continuous drawing."""
@@ -1261,8 +1710,7 @@ class RayCast3DStudio:
             self.font_data[self.font_selected_char] = [0, 0, 0, 0, 0]
             self._refresh_font_editor()
             self._refresh_font_grid()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
 
     def _font_invert_char(self):
         """Invert the selected character."""
@@ -1272,8 +1720,7 @@ class RayCast3DStudio:
                 char_bytes[i] = (~char_bytes[i]) & 0xFF
             self._refresh_font_editor()
             self._refresh_font_grid()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
 
     def _import_font(self):
         """Import a TTF/OTF font and render all characters to 5x8 bitmaps."""
@@ -1332,16 +1779,12 @@ class RayCast3DStudio:
                 ox = (5 - cw) // 2
                 oy = 0  # Top-aligned (descenders will naturally extend)
 
-                # Convert to column-encoded bytes
+                # Convert to column-encoded bytes: bit (oy + r) of column ox + c is pixel (c, r).
+                # The glyph was fitted to 5x7 above, so every column lands inside the 5 bytes.
                 new_bytes = [0, 0, 0, 0, 0]
-                pixels = cropped.load()
-                for c in range(cw):
-                    for r in range(ch):
-                        target_col = ox + c
-                        target_row = oy + r
-                        if 0 <= target_col < 5 and 0 <= target_row < 8:
-                            if pixels[c, r] > 127:  # Threshold
-                                new_bytes[target_col] |= (1 << target_row)
+                lit = np.asarray(cropped) > 127  # Threshold
+                column_bits = (lit << np.arange(oy, oy + ch)[:, None]).sum(axis=0)
+                new_bytes[ox:ox + cw] = column_bits.tolist()
 
                 self.font_data[char_idx] = new_bytes
 
@@ -1352,8 +1795,7 @@ class RayCast3DStudio:
             self._refresh_font_grid()
             if self.font_selected_char is not None:
                 self._refresh_font_editor()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
 
         except Exception as e:
             messagebox.showerror("Font Import Error", f"Failed to import font: {e}")
@@ -1366,8 +1808,7 @@ class RayCast3DStudio:
         self._refresh_font_grid()
         if self.font_selected_char is not None:
             self._refresh_font_editor()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _generate_font_h(self):
         """Generate font.h content from font_data."""
@@ -1447,59 +1888,73 @@ class RayCast3DStudio:
         return "\n".join(lines)
 
     def _refresh_color_list(self):
-        """Refresh the color list display."""
-        # Clear existing rows
-        for widget in self.color_list_frame.winfo_children():
-            widget.destroy()
-        self.color_rows = []
-        self.selected_color_rows = set()
-        self.last_color_click = None
-
-        for i, color in enumerate(self.colors):
-            # Name label
-            name_label = ttk.Label(self.color_list_frame, text=color.name, anchor='w')
-            name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
-            name_label.bind('<Button-1>', lambda e, idx=i: self._select_color_row(idx, e))
-            name_label.bind('<Double-Button-1>', lambda e, idx=i: self._edit_color_at(idx))
+        """Refresh the color list display, reusing existing row widgets."""
+        with self._batched_list_rebuild(self.color_canvas, self.color_canvas_window):
+            # Clear the selection first so reused rows go back to the plain style
+            self.selected_color_rows = set()
+            self._update_color_highlights()
+            self.last_color_click = None
 
-            # Color swatch (using a small canvas)
-            swatch = tk.Canvas(self.color_list_frame, width=40, height=20, highlightthickness=1, highlightbackground='gray')
-            swatch.create_rectangle(0, 0, 40, 20, fill=color.to_hex_string(), outline='')
-            swatch.grid(row=i, column=1, sticky='w', padx=5, pady=1)
-            swatch.bind('<Button-1>', lambda e, idx=i: self._select_color_row(idx, e))
-            swatch.bind('<Double-Button-1>', lambda e, idx=i: self._edit_color_at(idx))
+            self._sync_row_count(self.color_rows, len(self.colors), self._create_color_row)
 
-            # BGR565 value
-            bgr565_label = ttk.Label(self.color_list_frame, text=f"0x{color.to_bgr565():04X}", anchor='w', font=('Consolas', 9))
-            bgr565_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
-            bgr565_label.bind('<Button-1>', lambda e, idx=i: self._select_color_row(idx, e))
+            for idx in range(len(self.colors)):
+                self._update_color_row(idx)
 
-            # RGB values
-            rgb_label = ttk.Label(self.color_list_frame, text=f"({color.r}, {color.g}, {color.b})", anchor='w')
-            rgb_label.grid(row=i, column=3, sticky='w', padx=5, pady=1)
-            rgb_label.bind('<Button-1>', lambda e, idx=i: self._select_color_row(idx, e))
-
-            self.color_rows.append((name_label, swatch, bgr565_label, rgb_label))
+    def _update_color_row(self, idx):
+        """Update an existing color row's widgets in place after its color changed."""
+        if idx >= len(self.color_rows):
+            return
+        color = self.colors[idx]
+        name_label, swatch, bgr565_label, rgb_label = self.color_rows[idx]
+        name_label.configure(text=color.name)
+        swatch.configure(bg=color.to_hex_string())
+        bgr565_label.configure(text=f"0x{color.to_bgr565():04X}")
+        rgb_label.configure(text=f"({color.r}, {color.g}, {color.b})")
+
+    def _create_color_row(self, i):
+        """Create the widgets for color row i. Text and swatch color are filled in by _refresh_color_list."""
+        # Name label
+        name_label = ttk.Label(self.color_list_frame, anchor='w')
+        name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
+        self._add_row_tag(name_label, 'ColorRow')
+        self._add_row_tag(name_label, 'ColorRowEdit')
+
+        # Color swatch (a plain label background is far cheaper than a canvas)
+        swatch = tk.Label(self.color_list_frame, width=5, highlightthickness=1, highlightbackground='gray')
+        swatch.grid(row=i, column=1, sticky='w', padx=5, pady=1)
+        self._add_row_tag(swatch, 'ColorRow')
+        self._add_row_tag(swatch, 'ColorRowEdit')
+
+        # BGR565 value
+        bgr565_label = ttk.Label(self.color_list_frame, anchor='w', font=('Consolas', 9))
+        bgr565_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
+        self._add_row_tag(bgr565_label, 'ColorRow')
+
+        # RGB values
+        rgb_label = ttk.Label(self.color_list_frame, anchor='w')
+        rgb_label.grid(row=i, column=3, sticky='w', padx=5, pady=1)
+        self._add_row_tag(rgb_label, 'ColorRow')
+
+        return (name_label, swatch, bgr565_label, rgb_label)
 
     def _deselect_all_colors(self):
         """Deselect all color rows."""
-        for idx in list(self.selected_color_rows):
-            if idx < len(self.color_rows):
-                name_label, _, bgr565_label, rgb_label = self.color_rows[idx]
-                name_label.configure(background='')
-                bgr565_label.configure(background='')
-                rgb_label.configure(background='')
         self.selected_color_rows = set()
         self.last_color_click = None
+        self._update_color_highlights()
 
     def _update_color_highlights(self):
-        """Update visual highlighting for all color rows based on selection."""
-        for idx, row_data in enumerate(self.color_rows):
-            name_label, _, bgr565_label, rgb_label = row_data
-            bg = '#cce5ff' if idx in self.selected_color_rows else ''
-            name_label.configure(background=bg)
-            bgr565_label.configure(background=bg)
-            rgb_label.configure(background=bg)
+        """Update highlighting for color rows whose selection state changed."""
+        changed = self.selected_color_rows ^ self._highlighted_color_rows
+        for idx in changed:
+            if idx >= len(self.color_rows):
+                continue
+            name_label, _, bgr565_label, rgb_label = self.color_rows[idx]
+            style = 'Selected.TLabel' if idx in self.selected_color_rows else 'TLabel'
+            name_label.configure(style=style)
+            bgr565_label.configure(style=style)
+            rgb_label.configure(style=style)
+        self._highlighted_color_rows = {idx for idx in self.selected_color_rows if idx < len(self.color_rows)}
 
     def _select_color_row(self, idx, event=None):
         """Select a color row with multi-select support.
@@ -1563,8 +2018,7 @@ class RayCast3DStudio:
         self.colors.append(color)
 
         self._refresh_color_list()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _edit_color(self):
         """Edit the selected color (edits last clicked if multiple selected)."""
@@ -1589,11 +2043,10 @@ class RayCast3DStudio:
             return
 
         rgb = result[0]
-        color.r, color.g, color.b = int(rgb[0]), int(rgb[1]), int(rgb[2])
+        color.set_rgb(int(rgb[0]), int(rgb[1]), int(rgb[2]))
 
-        self._refresh_color_list()
-        self._auto_export()
-        self._save_project()
+        self._update_color_row(idx)
+        self._schedule_save()
 
     def _rename_color(self):
         """Rename the selected color."""
@@ -1621,9 +2074,8 @@ class RayCast3DStudio:
             return
 
         color.name = new_name
-        self._refresh_color_list()
-        self._auto_export()
-        self._save_project()
+        self._update_color_row(idx)
+        self._schedule_save()
 
     def _remove_colors(self):
         """Remove all selected colors (supports multi-select)."""
@@ -1640,52 +2092,45 @@ class RayCast3DStudio:
         self.selected_color_rows = set()
         self.last_color_click = None
         self._refresh_color_list()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
-    def _is_perimeter(self, row, col):
-        """Check if a cell is on the perimeter."""
-        return row == 0 or row == MAP_SIZE-1 or col == 0 or col == MAP_SIZE-1
+    def _on_tab_changed(self, event=None):
+        """Track map tab visibility and catch up on redraws deferred while hidden."""
+        self._map_tab_visible = self.notebook.index(self.notebook.select()) == 0
+        if self._map_tab_visible and self._map_dirty:
+            self._draw_map_grid()
 
     def _draw_map_grid(self):
         """Draw the map grid on canvas with actual texture images."""
+        # Nobody can see the map from other tabs; redraw once when it is shown again
+        if not self._map_tab_visible:
+            self._map_dirty = True
+            return
+        self._map_dirty = False
+        self._dirty_cells.clear()  # Full redraw covers any pending cell updates
+
+        # Tile PhotoImages are owned by their Texture (tex.tile_preview), which keeps
+        # them alive for as long as the canvas can reference them
         self.map_canvas.delete('all')
-        self.tile_images = {}  # Clear image references
 
         # Offset for coordinate labels
         offset = LABEL_MARGIN
 
-        for row in range(MAP_SIZE):
-            for col in range(MAP_SIZE):
-                x1 = col * CELL_SIZE + offset
-                y1 = row * CELL_SIZE + offset
-                x2 = x1 + CELL_SIZE
-                y2 = y1 + CELL_SIZE
-
-                val = self.map_data[row][col]
-
-                if val == 0:
-                    # Empty cell - black
-                    self.map_canvas.create_rectangle(x1, y1, x2, y2, fill='black', outline='#333333')
-                elif val > 0 and val <= len(self.textures):
-                    # Has texture - draw the texture tile
-                    tex = self.textures[val - 1]
-                    if tex.tile_preview:
-                        self.map_canvas.create_image(x1, y1, anchor='nw', image=tex.tile_preview)
-                        self.tile_images[(row, col)] = tex.tile_preview  # Keep reference
-                    else:
-                        # Fallback if no preview
-                        self.map_canvas.create_rectangle(x1, y1, x2, y2, fill='#666666', outline='#333333')
-                else:
-                    # Wall with no texture defined yet - gray placeholder
-                    self.map_canvas.create_rectangle(x1, y1, x2, y2, fill='#444444', outline='#333333')
+        # Empty cells are part of the background image, so only walls get canvas items
+        if self._map_bg_photo is None:
+            self._map_bg_photo = self._create_map_background()
+        self._map_bg_item = self.map_canvas.create_image(offset, offset, anchor='nw', image=self._map_bg_photo)
 
-        # Grid lines
-        for i in range(1, MAP_SIZE):
-            self.map_canvas.create_line(i * CELL_SIZE + offset, offset,
-                                        i * CELL_SIZE + offset, MAP_SIZE * CELL_SIZE + offset, fill='#333333')
-            self.map_canvas.create_line(offset, i * CELL_SIZE + offset,
-                                        MAP_SIZE * CELL_SIZE + offset, i * CELL_SIZE + offset, fill='#333333')
+        self._map_image_cells = set()
+        self.map_cell_ids = [[None] * MAP_SIZE for _ in range(MAP_SIZE)]
+        rows, cols = np.nonzero(self.map_data)
+        for row, col, val in zip(rows.tolist(), cols.tolist(), self.map_data[rows, cols].tolist()):
+            self.map_cell_ids[row][col] = self._create_map_cell(row, col, val)
+
+        # Grid lines: one transparent overlay image above the cells instead of a line item per row/column
+        if self._map_grid_photo is None:
+            self._map_grid_photo = self._create_map_grid_overlay()
+        self.map_canvas.create_image(offset, offset, anchor='nw', image=self._map_grid_photo)
 
         # Coordinate labels on grid lines (0-indexed)
         for i in range(1, MAP_SIZE):
@@ -1698,12 +2143,101 @@ class RayCast3DStudio:
             self.map_canvas.create_text(offset - 4, y_pos, text=str(i),
                                         fill='black', font=('Arial', 7), anchor='e')
 
+    def _create_map_background(self):
+        """Render the empty map grid (black cells with #333333 outlines) as a PhotoImage."""
+        size = MAP_SIZE * CELL_SIZE + 1
+        bg = Image.new("RGB", (size, size), (0, 0, 0))
+        draw = ImageDraw.Draw(bg)
+        for i in range(MAP_SIZE + 1):
+            pos = i * CELL_SIZE
+            draw.line([(pos, 0), (pos, size - 1)], fill='#333333')
+            draw.line([(0, pos), (size - 1, pos)], fill='#333333')
+        return ImageTk.PhotoImage(bg)
+
+    def _create_map_grid_overlay(self):
+        """Render the interior grid lines on a transparent PhotoImage that sits above the cells."""
+        size = MAP_SIZE * CELL_SIZE + 1
+        overlay = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        for i in range(1, MAP_SIZE):
+            pos = i * CELL_SIZE
+            draw.line([(pos, 0), (pos, size - 1)], fill='#333333')
+            draw.line([(0, pos), (size - 1, pos)], fill='#333333')
+        return ImageTk.PhotoImage(overlay)
+
+    def _map_cell_look(self, val):
+        """Return (tile PhotoImage, None), (None, rectangle fill), or (None, None) for an empty cell."""
+        if val == 0:
+            # Empty cell - shown by the background image
+            return None, None
+        elif val > 0 and val <= len(self.textures):
+            # Has texture - draw the texture tile
+            tex = self.textures[val - 1]
+            if tex.tile_preview:
+                return tex.tile_preview, None
+            # Fallback if no preview
+            return None, '#666666'
+        # Wall with no texture defined yet - gray placeholder
+        return None, '#444444'
+
+    def _create_map_cell(self, row, col, val):
+        """Draw one map cell on the canvas and return its item id (None for empty cells)."""
+        x1 = col * CELL_SIZE + LABEL_MARGIN
+        y1 = row * CELL_SIZE + LABEL_MARGIN
+
+        tile, fill = self._map_cell_look(val)
+        if tile is not None:
+            self._map_image_cells.add((row, col))
+            return self.map_canvas.create_image(x1, y1, anchor='nw', image=tile)
+        self._map_image_cells.discard((row, col))
+        if fill is None:
+            return None
+        return self.map_canvas.create_rectangle(x1, y1, x1 + CELL_SIZE, y1 + CELL_SIZE, fill=fill, outline='#333333')
+
+    def _mark_cell_dirty(self, row, col):
+        """Queue a cell for redraw; all cells changed before Tk goes idle are updated together."""
+        self._dirty_cells.add((row, col))
+        if not self._cell_redraw_pending:
+            self._cell_redraw_pending = True
+            self.root.after_idle(self._flush_dirty_cells)
+
+    def _flush_dirty_cells(self):
+        """Redraw the cells queued by _mark_cell_dirty."""
+        self._cell_redraw_pending = False
+        cells, self._dirty_cells = self._dirty_cells, set()
+        for row, col in cells:
+            self._redraw_map_cell(row, col)
+
+    def _redraw_map_cell(self, row, col):
+        """Update a single cell's canvas item after its map value changed."""
+        if not self._map_tab_visible or not self.map_cell_ids:
+            self._map_dirty = True
+            return
+        item = self.map_cell_ids[row][col]
+        tile, fill = self._map_cell_look(int(self.map_data[row, col]))
+
+        # Same kind of item: just reconfigure it
+        if item is not None and fill is not None and (row, col) not in self._map_image_cells:
+            self.map_canvas.itemconfigure(item, fill=fill)
+            return
+        if item is not None and tile is not None and (row, col) in self._map_image_cells:
+            self.map_canvas.itemconfigure(item, image=tile)
+            return
+
+        if item is not None:
+            self.map_canvas.delete(item)
+        item = self._create_map_cell(row, col, int(self.map_data[row, col]))
+        if item is not None:
+            # Cells never overlap, so sitting just above the background keeps grid lines and labels on top
+            self.map_canvas.tag_raise(item, self._map_bg_item)
+        self.map_cell_ids[row][col] = item
+
     def _on_map_click(self, event):
         """Handle map click."""
         self.is_drawing = True
 
         # Save current map state for undo before painting
-        self.map_undo_stack.append((self.current_map_idx, [row[:] for row in self.map_data]))
+        self.map_undo_stack.append((self.current_map_idx, self.map_data.copy()))
         if len(self.map_undo_stack) > 50:
             self.map_undo_stack.pop(0)
 
@@ -1711,8 +2245,8 @@ class RayCast3DStudio:
         col = (event.x - LABEL_MARGIN) // CELL_SIZE
         row = (event.y - LABEL_MARGIN) // CELL_SIZE
         if 0 <= row < MAP_SIZE and 0 <= col < MAP_SIZE:
-            current_value = self.map_data[row][col]
-            is_perimeter = self._is_perimeter(row, col)
+            current_value = self.map_data[row, col]
+            is_perimeter = MAP_PERIMETER_ROWS[row][col]
             
             # If clicking same texture on interior cell, enter erase mode
             if current_value == self.selected_texture_idx and not is_perimeter:
@@ -1720,20 +2254,32 @@ class RayCast3DStudio:
             else:
                 self.is_erasing = False
         
+        self._last_painted_cell = (row, col)
         self._paint_cell(event)
 
     def _on_map_drag(self, event):
         """Handle map drag."""
         if self.is_drawing:
-            self._paint_cell(event)
+            # Motion events arrive per pixel; only act when the pointer enters a new cell
+            cell = ((event.y - LABEL_MARGIN) // CELL_SIZE, (event.x - LABEL_MARGIN) // CELL_SIZE)
+            if cell == self._last_painted_cell:
+                return
+            last = self._last_painted_cell
+            self._last_painted_cell = cell
+            if last is None:
+                self._paint_cell_at(*cell)
+                return
+            # A fast drag can jump several cells between motion events; fill the gap
+            for row, col in grid_line_cells(last, cell)[1:]:
+                self._paint_cell_at(row, col)
 
     def _on_map_release(self, event):
         """Handle mouse release."""
         self.is_drawing = False
         self.is_erasing = False  # Reset erase mode
+        self._last_painted_cell = None
         # Auto-export and save on release
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _undo(self):
         """Undo the last map paint operation."""
@@ -1744,28 +2290,26 @@ class RayCast3DStudio:
                 self.maps[map_idx]["data"] = data
                 if self.current_map_idx == map_idx:
                     self._draw_map_grid()
-                self._auto_export()
-                self._save_project()
+                self._schedule_save()
 
     def _on_map_selected(self, event=None):
         """Handle map selection from dropdown."""
-        selected_name = self.map_selector_var.get()
-        for i, m in enumerate(self.maps):
-            if m["name"] == selected_name:
-                self.current_map_idx = i
-                self._draw_map_grid()
-                if hasattr(self, 'floor_tex_combo'):
-                    self._update_floor_texture_combo()
-                if hasattr(self, 'ceil_tex_combo'):
-                    self._update_ceil_texture_combo()
-                break
+        idx = self._map_index_by_name.get(self.map_selector_var.get())
+        if idx is None:
+            return
+        self.current_map_idx = idx
+        self._draw_map_grid()
+        if hasattr(self, 'floor_tex_combo'):
+            self._update_floor_texture_combo()
+        if hasattr(self, 'ceil_tex_combo'):
+            self._update_ceil_texture_combo()
 
     def _add_map(self):
         """Add a new map."""
         # Generate unique name
         base_name = "map"
         counter = len(self.maps) + 1
-        while any(m["name"] == f"{base_name}{counter}" for m in self.maps):
+        while f"{base_name}{counter}" in self._map_index_by_name:
             counter += 1
         new_name = f"{base_name}{counter}"
 
@@ -1777,20 +2321,19 @@ class RayCast3DStudio:
         name = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
 
         # Check for duplicate
-        if any(m["name"] == name for m in self.maps):
+        if name in self._map_index_by_name:
             messagebox.showerror("Error", f"Map '{name}' already exists.")
             return
 
         # Create new map with perimeter
-        new_map = {"name": name, "data": [[0 for _ in range(MAP_SIZE)] for _ in range(MAP_SIZE)]}
+        new_map = {"name": name, "data": np.zeros((MAP_SIZE, MAP_SIZE), dtype=np.uint8)}
         self.maps.append(new_map)
         self.current_map_idx = len(self.maps) - 1
         self._init_perimeter()
 
         self._update_map_selector()
         self._draw_map_grid()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _rename_map(self):
         """Rename the current map."""
@@ -1803,14 +2346,13 @@ class RayCast3DStudio:
         new_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in new_name)
 
         # Check for duplicate
-        if any(m["name"] == new_name for m in self.maps):
+        if new_name in self._map_index_by_name:
             messagebox.showerror("Error", f"Map '{new_name}' already exists.")
             return
 
         self.maps[self.current_map_idx]["name"] = new_name
         self._update_map_selector()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _delete_map(self):
         """Delete the current map."""
@@ -1827,28 +2369,33 @@ class RayCast3DStudio:
 
         self._update_map_selector()
         self._draw_map_grid()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _update_map_selector(self):
         """Update the map selector dropdown."""
+        self._map_index_by_name = {m["name"]: i for i, m in enumerate(self.maps)}
         self.map_selector['values'] = [m["name"] for m in self.maps]
         self.map_selector_var.set(self.maps[self.current_map_idx]["name"])
         self.map_count_label.config(text=f"({len(self.maps)} map(s))")
 
     def _paint_cell(self, event):
         """Paint a cell at mouse position."""
-        col = (event.x - LABEL_MARGIN) // CELL_SIZE
-        row = (event.y - LABEL_MARGIN) // CELL_SIZE
+        self._paint_cell_at((event.y - LABEL_MARGIN) // CELL_SIZE, (event.x - LABEL_MARGIN) // CELL_SIZE)
 
+    def _paint_cell_at(self, row, col):
+        """Paint (or erase, in erase mode) one map cell. Out-of-range cells are ignored."""
         if 0 <= row < MAP_SIZE and 0 <= col < MAP_SIZE:
-            is_perimeter = self._is_perimeter(row, col)
+            # Dragging generates many events per cell; skip writes that change nothing
+            if not self.is_erasing and self.map_data[row, col] == self.selected_texture_idx:
+                return
+
+            is_perimeter = MAP_PERIMETER_ROWS[row][col]
 
             # If in erase mode, erase the cell (but not perimeter)
             if self.is_erasing:
-                if not is_perimeter:
-                    self.map_data[row][col] = 0  # Erase
-                    self._draw_map_grid()
+                if not is_perimeter and self.map_data[row, col] != 0:
+                    self.map_data[row, col] = 0  # Erase
+                    self._mark_cell_dirty(row, col)
                 return
 
             # Normal painting mode
@@ -1860,8 +2407,8 @@ class RayCast3DStudio:
             if is_perimeter and self.selected_texture_idx > len(self.textures):
                 return  # No valid texture selected
 
-            self.map_data[row][col] = self.selected_texture_idx
-            self._draw_map_grid()
+            self.map_data[row, col] = self.selected_texture_idx
+            self._mark_cell_dirty(row, col)
 
     def _select_texture(self, idx):
         """Select a texture for painting."""
@@ -1881,18 +2428,11 @@ class RayCast3DStudio:
 
     def _update_texture_palette(self):
         """Update the texture palette in map tab."""
-        for widget in self.palette_inner.winfo_children():
-            widget.destroy()
-
-        for i, tex in enumerate(self.textures):
-            idx = i + 1
-            frame = ttk.Frame(self.palette_inner)
-            frame.pack(fill='x', pady=2)
-
-            # Show texture name with small preview
-            btn = ttk.Button(frame, text=tex.name,
-                            command=lambda i=idx: self._select_texture(i))
-            btn.pack(fill='x')
+        # Buttons are reused across refreshes; only their labels change
+        self._sync_row_count(self.palette_rows, len(self.textures), self._create_palette_row)
+        for (frame, btn), tex in zip(self.palette_rows, self.textures):
+            if btn.cget('text') != tex.name:
+                btn.configure(text=tex.name)
 
         # Also refresh the floor/ceiling texture dropdowns
         if hasattr(self, 'floor_tex_combo'):
@@ -1900,27 +2440,68 @@ class RayCast3DStudio:
         if hasattr(self, 'ceil_tex_combo'):
             self._update_ceil_texture_combo()
 
-    def _create_texture_previews(self, tex):
-        """Create both large preview (simulating in-game wall) and tile preview for a texture."""
-        try:
-            img = Image.open(tex.image_path)
+    def _create_palette_row(self, i):
+        """Build the palette button for texture index i (painted as map value i + 1)."""
+        frame = ttk.Frame(self.palette_inner)
+        frame.pack(fill='x', pady=2)
+        btn = ttk.Button(frame, command=lambda idx=i + 1: self._select_texture(idx))
+        btn.pack(fill='x')
+        return (frame, btn)
 
-            # First resize to target resolution (this is what goes in-game)
-            processed = resize_and_letterbox(img, tex.resolution, tex.resolution)
-            tex.pil_image = processed
+    def _create_texture_previews(self, tex, images=None):
+        """Create both large preview (simulating in-game wall) and tile preview for a texture.
 
-            # Create simulated wall view preview
-            tex.preview = self._create_wall_preview(processed, tex.resolution)
+        images is the (processed, tile) pair from load_texture_images, if the caller has it.
+        """
+        try:
+            processed, tile = images or load_texture_images(tex.image_path, tex.resolution)
+            tex.pil_image = processed
+            tex.c_array = None  # BGR565 data is regenerated from processed at export time
 
-            # Tile preview: scale to cell size with NEAREST
-            tile = processed.resize((CELL_SIZE, CELL_SIZE), Image.NEAREST)
-            tex.tile_preview = ImageTk.PhotoImage(tile)
+            # Wall view preview is built on demand when the texture is selected
+            tex.preview = None
 
-            # Regenerate C array
-            tex.c_array = image_to_bgr565_array(img, tex.resolution)
+            self._set_texture_tile(tex, tile)
         except Exception as e:
             print(f"Error creating previews for {tex.name}: {e}")
 
+    def _get_texture_preview(self, tex):
+        """Return the wall preview for a texture, building it on first use.
+
+        Only the last WALL_PREVIEW_CACHE_SIZE textures shown keep their preview; older
+        ones drop it and rebuild it if selected again. A dropped preview's PhotoImage is
+        repainted for the next texture that needs one, rather than allocating a new Tk image.
+        """
+        recent = self._wall_preview_textures
+        if tex in recent:
+            recent.remove(tex)
+        recent.append(tex)
+        spare = None
+        while len(recent) > WALL_PREVIEW_CACHE_SIZE:
+            evicted = recent.pop(0)
+            spare = evicted.preview or spare
+            evicted.preview = None
+        if tex.preview is None and tex.pil_image is not None:
+            preview_img = self._create_wall_preview(tex.pil_image, tex.resolution)
+            if spare is not None and (spare.width(), spare.height()) == preview_img.size:
+                spare.paste(preview_img)
+                tex.preview = spare
+            else:
+                tex.preview = ImageTk.PhotoImage(preview_img)
+        return tex.preview
+
+    def _forget_wall_preview(self, tex):
+        """Drop a removed or replaced texture from the wall preview LRU so it frees its slot."""
+        if tex in self._wall_preview_textures:
+            self._wall_preview_textures.remove(tex)
+
+    def _set_texture_tile(self, tex, tile):
+        """Set a texture's map tile from a CELL_SIZE PIL image, reusing its existing PhotoImage."""
+        if tex.tile_preview is not None:
+            tex.tile_preview.paste(tile)
+        else:
+            tex.tile_preview = ImageTk.PhotoImage(tile)
+
     def _create_wall_preview(self, texture_img, tex_resolution):
         """
         Create a SQUARE preview that simulates how the texture looks on a wall in-game.
@@ -1933,6 +2514,7 @@ class RayCast3DStudio:
         tex_y = (screen_y * tex_resolution) // wall_height
 
         This creates visible horizontal bands where rows "bunch up".
+        Returns PIL Image (not PhotoImage).
         """
         # Use a square preview for accurate representation
         preview_size = 128  # Square preview
@@ -1940,84 +2522,90 @@ class RayCast3DStudio:
         # Simulate typical wall rendering: texture stretched to ~120 pixels on 160px screen
         simulated_wall_height = 120
 
-        # Create preview image
-        preview = Image.new("RGB", (preview_size, preview_size), (0, 0, 0))
-        preview_pixels = preview.load()
-
-        texture_pixels = texture_img.convert("RGB").load()
+        texture = np.asarray(texture_img.convert("RGB"))
 
         # For each preview pixel, simulate the double-sampling that creates banding:
         # 1. First, simulate stretching: map preview_y -> simulated wall position
         # 2. Then, simulate raycaster sampling: wall position -> texture coordinate
+        coords = np.arange(preview_size)
 
-        for x in range(preview_size):
-            # Map preview x to texture x (simple scaling)
-            tex_x = (x * tex_resolution) // preview_size
-            tex_x = min(tex_x, tex_resolution - 1)
+        # Map preview x to texture x (simple scaling)
+        tex_x = np.minimum((coords * tex_resolution) // preview_size, tex_resolution - 1)
 
-            for y in range(preview_size):
-                # Step 1: Map preview coordinate to simulated wall position
-                # (scale preview down to simulated wall height proportionally)
-                wall_y = (y * simulated_wall_height) // preview_size
+        # Step 1: Map preview coordinate to simulated wall position
+        # (scale preview down to simulated wall height proportionally)
+        wall_y = (coords * simulated_wall_height) // preview_size
 
-                # Step 2: Simulate raycaster's integer division sampling
-                # This is where banding originates - integer division causes
-                # some texture rows to be selected multiple times
-                tex_y = (wall_y * tex_resolution) // simulated_wall_height
-                tex_y = min(tex_y, tex_resolution - 1)
+        # Step 2: Simulate raycaster's integer division sampling
+        # This is where banding originates - integer division causes
+        # some texture rows to be selected multiple times
+        tex_y = np.minimum((wall_y * tex_resolution) // simulated_wall_height, tex_resolution - 1)
 
-                preview_pixels[x, y] = texture_pixels[tex_x, tex_y]
-
-        return ImageTk.PhotoImage(preview)
+        return Image.fromarray(texture[tex_y[:, None], tex_x[None, :]], "RGB")
 
     def _refresh_texture_list(self):
-        """Refresh the texture list with inline dropdown."""
-        # Clear existing rows
-        for widget in self.texture_list_frame.winfo_children():
-            widget.destroy()
-        self.texture_rows = []
-        self.selected_texture_rows = set()
-        self.last_texture_click = None
-
-        for i, tex in enumerate(self.textures):
-            # Name label
-            name_label = ttk.Label(self.texture_list_frame, text=tex.name, anchor='w')
-            name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
-            name_label.bind('<Button-1>', lambda e, idx=i: self._select_texture_row(idx, e))
+        """Refresh the texture list with inline dropdown, reusing existing row widgets."""
+        with self._batched_list_rebuild(self.texture_canvas, self.texture_canvas_window):
+            # Clear the selection first so reused rows go back to the plain style
+            self.selected_texture_rows = set()
+            self._update_texture_highlights()
+            self.last_texture_click = None
 
-            # Resolution dropdown (always visible)
-            res_var = tk.StringVar(value=str(tex.resolution))
-            res_combo = ttk.Combobox(self.texture_list_frame, textvariable=res_var, values=["16", "32", "64", "128"],
-                                     width=7, state='readonly')
-            res_combo.grid(row=i, column=1, sticky='w', padx=5, pady=1)
-            res_combo.bind('<<ComboboxSelected>>', lambda e, idx=i, var=res_var: self._on_texture_resolution_change(idx, var))
+            self._sync_row_count(self.texture_rows, len(self.textures), self._create_texture_row)
 
-            # Memory label
-            mem_label = ttk.Label(self.texture_list_frame, text=f"{tex.memory_bytes()} bytes", anchor='w')
-            mem_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
-            mem_label.bind('<Button-1>', lambda e, idx=i: self._select_texture_row(idx, e))
+            for idx in range(len(self.textures)):
+                self._update_texture_row(idx)
 
-            self.texture_rows.append((name_label, res_var, res_combo, mem_label))
+    def _update_texture_row(self, idx):
+        """Update an existing texture row's widgets in place after its texture changed."""
+        if idx >= len(self.texture_rows):
+            return
+        tex = self.textures[idx]
+        name_label, res_var, _, mem_label = self.texture_rows[idx]
+        name_label.configure(text=tex.name)
+        res_var.set(str(tex.resolution))
+        mem_label.configure(text=f"{tex.memory_bytes()} bytes")
+
+    def _create_texture_row(self, i):
+        """Create the widgets for texture row i. Values are filled in by _refresh_texture_list."""
+        # Name label
+        name_label = ttk.Label(self.texture_list_frame, anchor='w')
+        name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
+        self._add_row_tag(name_label, 'TextureRow')
+
+        # Resolution dropdown (always visible)
+        res_var = tk.StringVar()
+        res_combo = ttk.Combobox(self.texture_list_frame, textvariable=res_var, values=["16", "32", "64", "128"],
+                                 width=7, state='readonly')
+        res_combo.grid(row=i, column=1, sticky='w', padx=5, pady=1)
+        self._add_row_tag(res_combo, 'TextureResCombo')
+
+        # Memory label
+        mem_label = ttk.Label(self.texture_list_frame, anchor='w')
+        mem_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
+        self._add_row_tag(mem_label, 'TextureRow')
+
+        return (name_label, res_var, res_combo, mem_label)
 
     def _deselect_all_textures(self):
         """Deselect all texture rows."""
-        for idx in list(self.selected_texture_rows):
-            if idx < len(self.texture_rows):
-                name_label, _, _, mem_label = self.texture_rows[idx]
-                name_label.configure(background='')
-                mem_label.configure(background='')
         self.selected_texture_rows = set()
         self.last_texture_click = None
+        self._update_texture_highlights()
         self.tex_preview_label.config(image='')
         self.tex_preview_info.config(text='Select a texture to see preview')
 
     def _update_texture_highlights(self):
-        """Update visual highlighting for all texture rows based on selection."""
-        for idx, row_data in enumerate(self.texture_rows):
-            name_label, _, _, mem_label = row_data
-            bg = '#cce5ff' if idx in self.selected_texture_rows else ''
-            name_label.configure(background=bg)
-            mem_label.configure(background=bg)
+        """Update highlighting for texture rows whose selection state changed."""
+        changed = self.selected_texture_rows ^ self._highlighted_texture_rows
+        for idx in changed:
+            if idx >= len(self.texture_rows):
+                continue
+            name_label, _, _, mem_label = self.texture_rows[idx]
+            style = 'Selected.TLabel' if idx in self.selected_texture_rows else 'TLabel'
+            name_label.configure(style=style)
+            mem_label.configure(style=style)
+        self._highlighted_texture_rows = {idx for idx in self.selected_texture_rows if idx < len(self.texture_rows)}
 
     def _select_texture_row(self, idx, event=None):
         """Select a texture row with multi-select support.
@@ -2055,8 +2643,9 @@ class RayCast3DStudio:
         # Show preview for last clicked item
         if self.last_texture_click is not None and self.last_texture_click < len(self.textures):
             tex = self.textures[self.last_texture_click]
-            if tex.preview:
-                self.tex_preview_label.config(image=tex.preview)
+            preview = self._get_texture_preview(tex)
+            if preview:
+                self.tex_preview_label.config(image=preview)
             count = len(self.selected_texture_rows)
             if count > 1:
                 self.tex_preview_info.config(text=f"{count} textures selected\n\n"
@@ -2080,8 +2669,9 @@ class RayCast3DStudio:
 
             if new_res != tex.resolution:
                 self._update_texture_resolution(tex, new_res)
-                self._refresh_texture_list()
-                # Reselect the row
+                self._update_texture_row(idx)
+                # Reselect just this row (also refreshes the preview)
+                self.selected_texture_rows = set()
                 self._select_texture_row(idx)
         except ValueError:
             pass
@@ -2093,18 +2683,29 @@ class RayCast3DStudio:
             return
 
         try:
-            img = Image.open(tex.image_path)
+            images = load_texture_images(tex.image_path, new_res)  # Decode now so read errors surface here
+            self._tex_bytes -= tex.memory_bytes()
             tex.resolution = new_res
-            tex.c_array = image_to_bgr565_array(img, new_res)
-            self._create_texture_previews(tex)
+            self._tex_bytes += tex.memory_bytes()
+            self._create_texture_previews(tex, images)
             self._update_texture_palette()
             self._draw_map_grid()
             self._update_memory_display()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
+            self._prefetch_texture_resolutions(tex)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update resolution: {e}")
 
+    def _prefetch_texture_resolutions(self, tex):
+        """Decode a texture's other dropdown resolutions on the worker pool.
+
+        Fills the load_texture_images cache, so switching resolution afterwards skips
+        decoding and resizing. Cached sizes return immediately.
+        """
+        for res in TEXTURE_RESOLUTIONS:
+            if res != tex.resolution:
+                self._io_pool.submit(load_texture_images, tex.image_path, res)
+
     def _add_texture(self):
         """Add a new texture."""
         file_path = _native_open_file_dialog(
@@ -2137,28 +2738,56 @@ class RayCast3DStudio:
 
         try:
             resolution = int(self.tex_res_var.get())
-            img = Image.open(file_path)
-            c_array = image_to_bgr565_array(img, resolution)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Failed to load texture: {e}")
+            return
 
+        # Decode, resize and convert off the Tk thread; _poll_texture finishes the add
+        future = self._io_pool.submit(self._prepare_texture, file_path, resolution)
+        self._poll_texture(future, name, file_path, resolution)
+
+    def _prepare_texture(self, file_path, resolution):
+        """Decode and convert a texture image. Runs on a worker thread, so no Tk calls here."""
+        processed, tile = load_texture_images(file_path, resolution)
+        c_array = rgb_to_bgr565_array(processed)
+        return processed, tile, c_array
+
+    def _poll_texture(self, future, name, file_path, resolution):
+        """Finish adding a texture on the Tk thread once its worker is done."""
+        if not future.done():
+            self.root.after(50, self._poll_texture, future, name, file_path, resolution)
+            return
+
+        try:
+            processed, tile, c_array = future.result()
             tex = Texture(name, file_path, resolution, c_array)
+            tex.pil_image = processed
+            self._set_texture_tile(tex, tile)
+
+            # The list may have changed while converting, so look the name up again
+            existing_idx = None
+            for i, t in enumerate(self.textures):
+                if t.name == name:
+                    existing_idx = i
+                    break
 
             if existing_idx is not None:
                 # Overwrite in place, preserving index
                 tex.index = self.textures[existing_idx].index
+                self._tex_bytes -= self.textures[existing_idx].memory_bytes()
+                self._forget_wall_preview(self.textures[existing_idx])
                 self.textures[existing_idx] = tex
             else:
                 tex.index = len(self.textures) + 1
                 self.textures.append(tex)
-
-            # Create previews (pixelated)
-            self._create_texture_previews(tex)
+            self._tex_bytes += tex.memory_bytes()
 
             self._refresh_texture_list()
             self._update_texture_palette()
             self._draw_map_grid()
             self._update_memory_display()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
+            self._prefetch_texture_resolutions(tex)
 
             # Select the texture
             select_idx = existing_idx if existing_idx is not None else len(self.textures) - 1
@@ -2188,21 +2817,27 @@ class RayCast3DStudio:
 
             removed_tex_num = idx + 1  # 1-based texture number in map
 
+            self._tex_bytes -= self.textures[idx].memory_bytes()
+            self._forget_wall_preview(self.textures[idx])
             del self.textures[idx]
 
-            # Update map cells: shift texture references down
-            for row in range(MAP_SIZE):
-                for col in range(MAP_SIZE):
-                    cell_val = self.map_data[row][col]
-                    if cell_val == removed_tex_num:
-                        # This cell used the removed texture
-                        if self._is_perimeter(row, col):
-                            self.map_data[row][col] = 1  # Reset to texture 1
-                        else:
-                            self.map_data[row][col] = 0  # Erase
-                    elif cell_val > removed_tex_num:
-                        # Shift down
-                        self.map_data[row][col] = cell_val - 1
+            # Update map cells: shift texture references down. Texture numbers are shared by
+            # every map, so all of them are remapped, not just the one being edited.
+            for map_info in self.maps:
+                data = map_info["data"]
+                used_removed = data == removed_tex_num
+                data[data > removed_tex_num] -= 1
+                # Cells that used the removed texture are erased, except perimeter walls reset to texture 1
+                data[used_removed] = 0
+                data[used_removed & MAP_PERIMETER] = 1
+                # Floor/ceiling use the same numbering: shift them too, and clear them
+                # (0 = gradient / solid color) if they used the removed texture
+                for key in ("floor_texture", "ceiling_texture"):
+                    tex_num = map_info.get(key, 0)
+                    if tex_num == removed_tex_num:
+                        map_info[key] = 0
+                    elif tex_num > removed_tex_num:
+                        map_info[key] = tex_num - 1
 
         # Update texture indices
         for i, tex in enumerate(self.textures):
@@ -2211,11 +2846,10 @@ class RayCast3DStudio:
         self.selected_texture_rows = set()
         self.last_texture_click = None
         self._refresh_texture_list()
-        self._update_texture_palette()
+        self._update_texture_palette()  # Also reloads the floor/ceiling dropdowns from the remapped maps
         self._draw_map_grid()
         self._update_memory_display()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
         # Clear preview
         self.tex_preview_label.config(image='')
@@ -2247,10 +2881,9 @@ class RayCast3DStudio:
             return
 
         texture.name = new_name
-        self._refresh_texture_list()
+        self._update_texture_row(idx)
         self._update_texture_palette()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
     def _detect_transparent_color(self, img, width, height):
         """
@@ -2261,91 +2894,89 @@ class RayCast3DStudio:
         """
         img_resized = resize_and_letterbox(img, width, height)
 
-        # Check if image has alpha channel
-        if img_resized.mode == 'RGBA' or 'A' in img_resized.getbands():
-            img_rgba = img_resized.convert("RGBA")
-            pixels_rgba = img_rgba.load()
-
-            # Check if there are any transparent pixels
-            has_transparency = False
-            for y in range(height):
-                for x in range(width):
-                    if pixels_rgba[x, y][3] < 128:  # Alpha < 50%
-                        has_transparency = True
-                        break
-                if has_transparency:
-                    break
+        # Check if image has alpha channel. resize_and_letterbox flattens to RGB, so the alpha
+        # band is taken from the source and letterboxed the same way (padding comes out
+        # transparent, which matches its black fill)
+        if 'A' in img.getbands():
+            alpha = resize_and_letterbox(img.getchannel('A'), width, height)
+            transparent_mask = np.asarray(alpha)[..., 0] < 128  # Alpha < 50%
 
-            if has_transparency:
+            if transparent_mask.any():
                 # Replace transparent pixels with black, use black as transparent key
-                img_rgb = Image.new("RGB", (width, height), (0, 0, 0))
-                for y in range(height):
-                    for x in range(width):
-                        r, g, b, a = pixels_rgba[x, y]
-                        if a >= 128:
-                            img_rgb.putpixel((x, y), (r, g, b))
-                        # else leave as black (transparent)
-                return 0x0000, img_rgb  # Black is transparent
+                rgb = np.array(img_resized)
+                rgb[transparent_mask] = 0
+                return 0x0000, Image.fromarray(rgb, "RGB")  # Black is transparent
 
         # No alpha or no transparent pixels - use top-left corner as transparent
-        img_rgb = img_resized.convert("RGB")
-        pixels = img_rgb.load()
-        r, g, b = pixels[0, 0]  # Top-left corner
-        blue5 = b >> 3
-        green6 = g >> 2
-        red5 = r >> 3
-        transparent = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
+        # (resize_and_letterbox hands back a fresh RGB image, which convert() would copy again)
+        img_rgb = img_resized if img_resized.mode == "RGB" else img_resized.convert("RGB")
+        transparent = rgb_to_bgr565(*img_rgb.getpixel((0, 0)))  # Top-left corner
 
         return transparent, img_rgb
 
     def _refresh_sprite_list(self):
-        """Refresh the sprite list with inline dropdown."""
-        # Clear existing rows
-        for widget in self.sprite_list_frame.winfo_children():
-            widget.destroy()
-        self.sprite_rows = []
-        self.selected_sprite_rows = set()
-        self.last_sprite_click = None
-
-        for i, sprite in enumerate(self.sprites):
-            # Name label
-            name_label = ttk.Label(self.sprite_list_frame, text=sprite.name, anchor='w')
-            name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
-            name_label.bind('<Button-1>', lambda e, idx=i: self._select_sprite_row(idx, e))
-
-            # Resolution dropdown (always visible)
-            res_var = tk.StringVar(value=str(sprite.resolution))
-            res_combo = ttk.Combobox(self.sprite_list_frame, textvariable=res_var, values=["16", "32", "64", "128"],
-                                     width=7, state='readonly')
-            res_combo.grid(row=i, column=1, sticky='w', padx=5, pady=1)
-            res_combo.bind('<<ComboboxSelected>>', lambda e, idx=i, var=res_var: self._on_sprite_resolution_change(idx, var))
-
-            # Memory label
-            mem_label = ttk.Label(self.sprite_list_frame, text=f"{sprite.memory_bytes()} bytes", anchor='w')
-            mem_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
-            mem_label.bind('<Button-1>', lambda e, idx=i: self._select_sprite_row(idx, e))
-
-            self.sprite_rows.append((name_label, res_var, res_combo, mem_label))
+        """Refresh the sprite list with inline dropdown, reusing existing row widgets."""
+        with self._batched_list_rebuild(self.sprite_canvas, self.sprite_canvas_window):
+            # Clear the selection first so reused rows go back to the plain style
+            self.selected_sprite_rows = set()
+            self._update_sprite_highlights()
+            self.last_sprite_click = None
+
+            self._sync_row_count(self.sprite_rows, len(self.sprites), self._create_sprite_row)
+
+            for idx in range(len(self.sprites)):
+                self._update_sprite_row(idx)
+
+    def _create_sprite_row(self, i):
+        """Create the widgets for sprite row i. Values are filled in by _update_sprite_row."""
+        # Name label
+        name_label = ttk.Label(self.sprite_list_frame, anchor='w')
+        name_label.grid(row=i, column=0, sticky='w', padx=5, pady=1)
+        self._add_row_tag(name_label, 'SpriteRow')
+
+        # Resolution dropdown (always visible)
+        res_var = tk.StringVar()
+        res_combo = ttk.Combobox(self.sprite_list_frame, textvariable=res_var, values=["16", "32", "64", "128"],
+                                 width=7, state='readonly')
+        res_combo.grid(row=i, column=1, sticky='w', padx=5, pady=1)
+        self._add_row_tag(res_combo, 'SpriteResCombo')
+
+        # Memory label
+        mem_label = ttk.Label(self.sprite_list_frame, anchor='w')
+        mem_label.grid(row=i, column=2, sticky='w', padx=5, pady=1)
+        self._add_row_tag(mem_label, 'SpriteRow')
+
+        return (name_label, res_var, res_combo, mem_label)
+
+    def _update_sprite_row(self, idx):
+        """Update an existing sprite row's widgets in place after its sprite changed."""
+        if idx >= len(self.sprite_rows):
+            return
+        sprite = self.sprites[idx]
+        name_label, res_var, _, mem_label = self.sprite_rows[idx]
+        name_label.configure(text=sprite.name)
+        res_var.set(str(sprite.resolution))
+        mem_label.configure(text=f"{sprite.memory_bytes()} bytes")
 
     def _deselect_all_sprites(self):
         """Deselect all sprite rows."""
-        for idx in list(self.selected_sprite_rows):
-            if idx < len(self.sprite_rows):
-                name_label, _, _, mem_label = self.sprite_rows[idx]
-                name_label.configure(background='')
-                mem_label.configure(background='')
         self.selected_sprite_rows = set()
+        self._update_sprite_highlights()
         self.last_sprite_click = None
         self.sprite_preview_label.config(image='')
         self.sprite_preview_info.config(text='Select a sprite to see preview')
 
     def _update_sprite_highlights(self):
-        """Update visual highlighting for all sprite rows based on selection."""
-        for idx, row_data in enumerate(self.sprite_rows):
-            name_label, _, _, mem_label = row_data
-            bg = '#cce5ff' if idx in self.selected_sprite_rows else ''
-            name_label.configure(background=bg)
-            mem_label.configure(background=bg)
+        """Update highlighting for sprite rows whose selection state changed."""
+        changed = self.selected_sprite_rows ^ self._highlighted_sprite_rows
+        for idx in changed:
+            if idx >= len(self.sprite_rows):
+                continue
+            name_label, _, _, mem_label = self.sprite_rows[idx]
+            style = 'Selected.TLabel' if idx in self.selected_sprite_rows else 'TLabel'
+            name_label.configure(style=style)
+            mem_label.configure(style=style)
+        self._highlighted_sprite_rows = {idx for idx in self.selected_sprite_rows if idx < len(self.sprite_rows)}
 
     def _select_sprite_row(self, idx, event=None):
         """Select a sprite row with multi-select support.
@@ -2378,13 +3009,22 @@ class RayCast3DStudio:
                 self.selected_sprite_rows = {idx}
                 self.last_sprite_click = idx
 
+        # Repaint once per burst of selection events (e.g. rapid shift-clicks)
+        if not self._sprite_selection_pending:
+            self._sprite_selection_pending = True
+            self.root.after_idle(self._flush_sprite_selection)
+
+    def _flush_sprite_selection(self):
+        """Apply the current sprite selection to row highlights and the preview pane."""
+        self._sprite_selection_pending = False
         self._update_sprite_highlights()
 
         # Show preview for last clicked item
         if self.last_sprite_click is not None and self.last_sprite_click < len(self.sprites):
             sprite = self.sprites[self.last_sprite_click]
-            if sprite.preview:
-                self.sprite_preview_label.config(image=sprite.preview)
+            preview = self._get_sprite_preview(sprite)
+            if preview:
+                self.sprite_preview_label.config(image=preview)
             count = len(self.selected_sprite_rows)
             if count > 1:
                 self.sprite_preview_info.config(text=f"{count} sprites selected\n\n"
@@ -2404,6 +3044,15 @@ class RayCast3DStudio:
             self.sprite_preview_info.config(text='Select a sprite to see preview')
             self.edit_sprite_btn.config(state='disabled')
 
+    def _on_sprite_row_click(self, event):
+        """Handle a click on any sprite row widget."""
+        self._select_sprite_row(self._row_of(event.widget), event)
+
+    def _on_sprite_res_selected(self, event):
+        """Handle a sprite row's resolution combobox selection."""
+        combo = event.widget
+        self._on_sprite_resolution_change(self._row_of(combo), combo)
+
     def _on_sprite_resolution_change(self, idx, var):
         """Handle sprite resolution dropdown change."""
         if idx >= len(self.sprites):
@@ -2422,8 +3071,10 @@ class RayCast3DStudio:
                         var.set(str(sprite.resolution))  # Revert dropdown
                         return
                 self._update_sprite_resolution(sprite, new_res)
-                self._refresh_sprite_list()
+                self._update_sprite_row(idx)
                 # Reselect the row
+                self.selected_sprite_rows = set()
+                self.last_sprite_click = None
                 self._select_sprite_row(idx)
         except ValueError:
             pass
@@ -2434,53 +3085,27 @@ class RayCast3DStudio:
         old_res = sprite.resolution
         try:
             if os.path.exists(sprite.image_path):
-                img = Image.open(sprite.image_path)
-
                 # Re-apply saved crop bounds if present
-                if sprite.crop_bounds is not None:
-                    x1, y1, x2, y2 = sprite.crop_bounds
-                    img = img.crop((x1, y1, x2, y2))
-
+                img = load_source_image(sprite.image_path, new_res, sprite.crop_bounds)
                 transparent, img_rgb = self._detect_transparent_color(img, new_res, new_res)
-            elif sprite.c_array and len(sprite.c_array) == old_res * old_res:
+            elif len(sprite.c_array) == old_res * old_res:
                 # Fallback: resample from current pixel data
-                current_img = Image.new("RGB", (old_res, old_res))
-                px = current_img.load()
-                for i, hex_val in enumerate(sprite.c_array):
-                    bgr565 = int(hex_val, 16)
-                    blue5 = (bgr565 >> 11) & 0x1F
-                    green6 = (bgr565 >> 5) & 0x3F
-                    red5 = bgr565 & 0x1F
-                    r = (red5 << 3) | (red5 >> 2)
-                    g = (green6 << 2) | (green6 >> 4)
-                    b = (blue5 << 3) | (blue5 >> 2)
-                    px[i % old_res, i // old_res] = (r, g, b)
+                current_img = bgr565_array_to_image(sprite.c_array, old_res)
                 img_rgb = resize_and_letterbox(current_img, new_res, new_res)
                 transparent = sprite.transparent
             else:
                 messagebox.showerror("Error", f"Image file not found and no pixel data available.")
                 return
 
-            pixels = img_rgb.load()
-
-            c_vals = []
-            for y in range(new_res):
-                for x in range(new_res):
-                    r, g, b = pixels[x, y]
-                    blue5 = b >> 3
-                    green6 = g >> 2
-                    red5 = r >> 3
-                    color = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
-                    c_vals.append(f"0x{color:04X}")
-
+            self._sprite_bytes -= sprite.memory_bytes()
             sprite.resolution = new_res
-            sprite.c_array = c_vals
+            self._sprite_bytes += sprite.memory_bytes()
+            sprite.c_array, preview_img = self._pack_sprite(img_rgb, new_res, transparent)
             sprite.transparent = transparent
-            sprite.preview = self._create_sprite_preview(img_rgb, new_res, new_res, transparent)
+            self._set_sprite_preview(sprite, preview_img)
 
             self._update_memory_display()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update resolution: {e}")
 
@@ -2504,53 +3129,71 @@ class RayCast3DStudio:
         name = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
 
         # Check for duplicate name and ask to overwrite
-        existing_idx = None
-        for i, s in enumerate(self.sprites):
-            if s.name == name:
-                existing_idx = i
-                break
-        if existing_idx is not None:
+        if name in self._sprite_names:
             if not messagebox.askyesno("Duplicate Sprite",
                     f"A sprite named \"{name}\" already exists. Overwrite it?"):
                 return
 
         try:
             resolution = int(self.sprite_res_var.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Failed to load sprite: {e}")
+            return
 
-            img = Image.open(file_path)
+        # Decode and convert off the Tk thread; _poll_sprite finishes the add
+        future = self._io_pool.submit(self._prepare_sprite, file_path, resolution)
+        self._poll_sprite(future, name, file_path, resolution)
 
-            # Detect transparent color and get processed image
-            transparent, img_rgb = self._detect_transparent_color(img, resolution, resolution)
-            pixels = img_rgb.load()
+    def _prepare_sprite(self, file_path, resolution):
+        """Decode and convert a sprite image. Runs on a worker thread, so no Tk calls here."""
+        img = load_source_image(file_path, resolution)
 
-            # Convert to BGR565
-            c_vals = []
-            for y in range(resolution):
-                for x in range(resolution):
-                    r, g, b = pixels[x, y]
-                    blue5 = b >> 3
-                    green6 = g >> 2
-                    red5 = r >> 3
-                    color = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
-                    c_vals.append(f"0x{color:04X}")
+        # Detect transparent color and get processed image
+        transparent, img_rgb = self._detect_transparent_color(img, resolution, resolution)
 
-            sprite = Sprite(name, file_path, resolution, c_vals, transparent)
+        # Convert to BGR565 plus the preview (PhotoImage is made on the Tk thread)
+        c_array, preview_img = self._pack_sprite(img_rgb, resolution, transparent)
+        return transparent, c_array, preview_img
 
-            # Create transparency-aware preview with checkerboard background
-            sprite.preview = self._create_sprite_preview(img_rgb, resolution, resolution, transparent)
+    def _convert_sprite_source(self, file_path, resolution):
+        """Decode a sprite source and return (transparent, c_array). Runs on a worker thread."""
+        img = load_source_image(file_path, resolution)
+        transparent, img_rgb = self._detect_transparent_color(img, resolution, resolution)
+        return transparent, rgb_to_bgr565_array(img_rgb)
+
+    def _poll_sprite(self, future, name, file_path, resolution):
+        """Finish adding a sprite on the Tk thread once its worker is done."""
+        if not future.done():
+            self.root.after(50, self._poll_sprite, future, name, file_path, resolution)
+            return
+
+        try:
+            transparent, c_array, preview_img = future.result()
+            sprite = Sprite(name, file_path, resolution, c_array, transparent)
+            self._set_sprite_preview(sprite, preview_img)
+
+            # The list may have changed while converting, so look the name up again
+            existing_idx = None
+            if name in self._sprite_names:
+                existing_idx = next(i for i, s in enumerate(self.sprites) if s.name == name)
 
             if existing_idx is not None:
+                self._sprite_bytes -= self.sprites[existing_idx].memory_bytes()
                 self.sprites[existing_idx] = sprite
             else:
                 self.sprites.append(sprite)
+                self._sprite_names.add(name)
+            self._sprite_bytes += sprite.memory_bytes()
 
-            self._refresh_sprite_list()
+            # Only the new (or replaced) row changes; the others keep their widgets as they are
+            select_idx = existing_idx if existing_idx is not None else len(self.sprites) - 1
+            self._sync_row_count(self.sprite_rows, len(self.sprites), self._create_sprite_row)
+            self._update_sprite_row(select_idx)
             self._update_memory_display()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
 
-            # Select the sprite
-            select_idx = existing_idx if existing_idx is not None else len(self.sprites) - 1
+            # Select the sprite (cleared first, since selecting the only selected row toggles it off)
+            self.selected_sprite_rows = set()
             self._select_sprite_row(select_idx)
 
         except Exception as e:
@@ -2566,14 +3209,30 @@ class RayCast3DStudio:
 
         for idx in indices_to_remove:
             if idx < len(self.sprites):
+                self._sprite_bytes -= self.sprites[idx].memory_bytes()
+                self._sprite_names.discard(self.sprites[idx].name)
                 del self.sprites[idx]
-
+                # Drop just this row's widgets; survivors are re-gridded below
+                name_label, _, res_combo, mem_label = self.sprite_rows.pop(idx)
+                name_label.destroy()
+                res_combo.destroy()
+                mem_label.destroy()
+
+        for i, (name_label, _, res_combo, mem_label) in enumerate(self.sprite_rows):
+            name_label.grid_configure(row=i)
+            res_combo.grid_configure(row=i)
+            mem_label.grid_configure(row=i)
+
+        # Highlights can lag the selection while a _flush_sprite_selection is queued, so
+        # remap the highlighted rows that survived to their new indices and clear them below
+        self._highlighted_sprite_rows = {
+            i - sum(r < i for r in indices_to_remove)
+            for i in self._highlighted_sprite_rows if i not in indices_to_remove}
         self.selected_sprite_rows = set()
+        self._update_sprite_highlights()
         self.last_sprite_click = None
-        self._refresh_sprite_list()
         self._update_memory_display()
-        self._auto_export()
-        self._save_project()
+        self._schedule_save()
 
         # Clear preview
         self.sprite_preview_label.config(image='')
@@ -2600,14 +3259,15 @@ class RayCast3DStudio:
         new_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in new_name)
 
         # Check for duplicate
-        if any(s.name == new_name for s in self.sprites):
+        if new_name in self._sprite_names:
             messagebox.showerror("Error", f"Sprite '{new_name}' already exists.")
             return
 
+        self._sprite_names.discard(sprite.name)
+        self._sprite_names.add(new_name)
         sprite.name = new_name
-        self._refresh_sprite_list()
-        self._auto_export()
-        self._save_project()
+        self._update_sprite_row(idx)
+        self._schedule_save()
 
     def _edit_sprite_transparency(self):
         """Open sprite editor dialog with sidebar tools and a single editing canvas."""
@@ -2623,32 +3283,19 @@ class RayCast3DStudio:
 
         # Store original state for cancel/discard
         original_transparent = sprite.transparent
-        original_c_array = sprite.c_array[:] if sprite.c_array else None
+        original_c_array = sprite.c_array.copy() if len(sprite.c_array) else None
         original_crop_bounds = sprite.crop_bounds
 
         # Load image from c_array if it exists (preserves previous edits), otherwise from file
         try:
-            if sprite.c_array and len(sprite.c_array) == sprite.resolution * sprite.resolution:
-                img_rgb = Image.new("RGB", (sprite.resolution, sprite.resolution))
-                pixels = img_rgb.load()
-                for i, hex_val in enumerate(sprite.c_array):
-                    bgr565 = int(hex_val, 16)
-                    blue5 = (bgr565 >> 11) & 0x1F
-                    green6 = (bgr565 >> 5) & 0x3F
-                    red5 = bgr565 & 0x1F
-                    r = (red5 << 3) | (red5 >> 2)
-                    g = (green6 << 2) | (green6 >> 4)
-                    b = (blue5 << 3) | (blue5 >> 2)
-                    x = i % sprite.resolution
-                    y = i // sprite.resolution
-                    pixels[x, y] = (r, g, b)
+            if len(sprite.c_array) == sprite.resolution * sprite.resolution:
+                img_rgb = bgr565_array_to_image(sprite.c_array, sprite.resolution)
             else:
                 if not os.path.exists(sprite.image_path):
                     messagebox.showerror("Error", f"Image file not found: {sprite.image_path}")
                     return
-                img = Image.open(sprite.image_path)
-                img_resized = resize_and_letterbox(img, sprite.resolution, sprite.resolution)
-                img_rgb = img_resized.convert("RGB")
+                img = load_source_image(sprite.image_path, sprite.resolution)
+                img_rgb = resize_and_letterbox(img, sprite.resolution, sprite.resolution)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {e}")
             return
@@ -2698,13 +3345,20 @@ class RayCast3DStudio:
         crop_display_size_x = crop_display_size_y = 0
         crop_display_offset_x = crop_display_offset_y = 0
 
-        # Load original source image for high-quality cropping
+        # Original source image for high-quality cropping, decoded when the crop tool is first used
         original_source_img = None
-        if sprite.image_path and os.path.exists(sprite.image_path):
-            try:
-                original_source_img = Image.open(sprite.image_path).convert("RGB")
-            except Exception:
-                original_source_img = None
+        original_source_loaded = False
+
+        def _load_original_source():
+            nonlocal original_source_img, original_source_loaded
+            if original_source_loaded:
+                return
+            original_source_loaded = True
+            if sprite.image_path and os.path.exists(sprite.image_path):
+                try:
+                    original_source_img = Image.open(sprite.image_path).convert("RGB")
+                except Exception:
+                    original_source_img = None
 
         # Tool radio buttons
         tool_var = tk.StringVar(value='pick')
@@ -2810,10 +3464,12 @@ class RayCast3DStudio:
         thumb_size = 160
         thumb_label = ttk.Label(sidebar)
         thumb_label.pack(padx=5, pady=5)
+        thumb_photo = ImageTk.PhotoImage("RGB", (thumb_size, thumb_size))  # Repainted with paste()
+        thumb_label.config(image=thumb_photo)
+        thumb_label.image = thumb_photo
 
         def update_source_thumbnail():
             """Update the small source reference thumbnail (no transparency)."""
-            thumb_img = img_rgb.resize((thumb_size, thumb_size), Image.NEAREST)
             padded = Image.new("RGB", (thumb_size, thumb_size), (200, 200, 200))
             # Center sprite in thumbnail
             actual_display = min(thumb_size, sprite.resolution * max(1, thumb_size // sprite.resolution))
@@ -2821,9 +3477,7 @@ class RayCast3DStudio:
             paste_x = (thumb_size - actual_display) // 2
             paste_y = (thumb_size - actual_display) // 2
             padded.paste(thumb_img, (paste_x, paste_y))
-            photo = ImageTk.PhotoImage(padded)
-            thumb_label.config(image=photo)
-            thumb_label.image = photo
+            thumb_photo.paste(padded)
 
         update_source_thumbnail()
 
@@ -2875,18 +3529,54 @@ class RayCast3DStudio:
             offset_x = int(canvas_size / 2 - pan_cx * scale)
             offset_y = int(canvas_size / 2 - pan_cy * scale)
 
+        canvas_photo = None  # Reused for every canvas render; repainted with paste()
+        canvas_view_item = None
+
+        def show_canvas_image(canvas_img):
+            """Show a canvas_size image on the canvas, removing any other items (crop overlay)."""
+            nonlocal canvas_photo, canvas_view_item
+            if canvas_photo is None:
+                canvas_photo = ImageTk.PhotoImage(canvas_img)
+                canvas_view_item = canvas.create_image(0, 0, anchor='nw', image=canvas_photo)
+                canvas.image = canvas_photo
+            else:
+                canvas_photo.paste(canvas_img)
+            stale = [item for item in canvas.find_all() if item != canvas_view_item]
+            if stale:
+                canvas.delete(*stale)
+
         def update_canvas():
             """Render the main canvas with transparency checkerboard."""
             _recalc_view()
             preview_img = self._create_sprite_preview_image(
                 img_rgb, sprite.resolution, sprite.resolution, sprite.transparent)
-            preview_img = preview_img.resize((display_size, display_size), Image.NEAREST)
             canvas_img = Image.new("RGB", (canvas_size, canvas_size), (200, 200, 200))
-            canvas_img.paste(preview_img, (offset_x, offset_y))
-            photo = ImageTk.PhotoImage(canvas_img)
-            canvas.delete('all')
-            canvas.create_image(0, 0, anchor='nw', image=photo)
-            canvas.image = photo
+            # Zoomed in, the scaled sprite can be thousands of pixels across; only sample
+            # (nearest neighbour) the part of it that actually lands on the canvas
+            x0, y0 = max(0, -offset_x), max(0, -offset_y)
+            x1, y1 = min(display_size, canvas_size - offset_x), min(display_size, canvas_size - offset_y)
+            if x0 < x1 and y0 < y1:
+                src_size = preview_img.width
+                cols = (np.arange(x0, x1) * 2 + 1) * src_size // (2 * display_size)
+                rows = (np.arange(y0, y1) * 2 + 1) * src_size // (2 * display_size)
+                visible = np.asarray(preview_img)[rows[:, None], cols]
+                canvas_img.paste(Image.fromarray(visible, "RGB"), (offset_x + x0, offset_y + y0))
+            show_canvas_image(canvas_img)
+
+        pending_redraws = set()  # Render functions queued for the next idle tick
+
+        def schedule_redraw(*renders):
+            """Run each render once when Tk goes idle, however many drag events asked for it."""
+            if not pending_redraws:
+                self.root.after_idle(flush_redraws)
+            pending_redraws.update(renders)
+
+        def flush_redraws():
+            renders = list(pending_redraws)
+            pending_redraws.clear()
+            if dialog.winfo_exists():  # The editor may have closed before Tk went idle
+                for render in renders:
+                    render()
 
         def on_scroll_zoom(event):
             """Scroll to zoom, centered on the mouse cursor position."""
@@ -2945,7 +3635,7 @@ class RayCast3DStudio:
             _pan_drag_start[1] = event.y
             pan_cx -= dx / scale
             pan_cy -= dy / scale
-            update_canvas()
+            schedule_redraw(update_canvas)
 
         def on_pan_end(event):
             _pan_drag_start[0] = None
@@ -3011,6 +3701,7 @@ class RayCast3DStudio:
             nonlocal crop_display_scale, crop_display_size_x, crop_display_size_y
             nonlocal crop_display_offset_x, crop_display_offset_y
 
+            _load_original_source()
             if original_source_img is not None:
                 crop_source_img = original_source_img
             else:
@@ -3030,10 +3721,7 @@ class RayCast3DStudio:
                 (crop_display_size_x, crop_display_size_y), Image.LANCZOS)
             canvas_img = Image.new("RGB", (canvas_size, canvas_size), (200, 200, 200))
             canvas_img.paste(display_img, (crop_display_offset_x, crop_display_offset_y))
-            photo = ImageTk.PhotoImage(canvas_img)
-            canvas.delete('all')
-            canvas.create_image(0, 0, anchor='nw', image=photo)
-            canvas.image = photo
+            show_canvas_image(canvas_img)
 
         def _crop_canvas_coords():
             s = crop_display_scale
@@ -3164,12 +3852,8 @@ class RayCast3DStudio:
                 coords = canvas_to_sprite(event)
                 if coords:
                     sprite_x, sprite_y = coords
-                    pixels = img_rgb.load()
-                    r, g, b = pixels[sprite_x, sprite_y]
-                    blue5 = b >> 3
-                    green6 = g >> 2
-                    red5 = r >> 3
-                    new_transparent = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
+                    r, g, b = img_rgb.getpixel((sprite_x, sprite_y))
+                    new_transparent = rgb_to_bgr565(r, g, b)
 
                     sprite_undo_stack.append((img_rgb.copy(), sprite.transparent))
                     if len(sprite_undo_stack) > 50:
@@ -3265,41 +3949,40 @@ class RayCast3DStudio:
             if not coords:
                 return
             center_x, center_y = coords
-            pixels = img_rgb.load()
             radius = brush_size
 
-            for dy in range(-radius, radius + 1):
-                for dx in range(-radius, radius + 1):
-                    if dx * dx + dy * dy <= radius * radius:
-                        sx = center_x + dx
-                        sy = center_y + dy
-                        if 0 <= sx < sprite.resolution and 0 <= sy < sprite.resolution:
-                            if edit_mode == 'erase':
-                                trans_b = ((sprite.transparent >> 11) & 0x1F) << 3
-                                trans_g = ((sprite.transparent >> 5) & 0x3F) << 2
-                                trans_r = (sprite.transparent & 0x1F) << 3
-                                pixels[sx, sy] = (trans_r, trans_g, trans_b)
-                            elif edit_mode == 'de_erase':
-                                cr, cg, cb = pixels[sx, sy]
-                                cur_bgr = ((cb >> 3) << 11) | ((cg >> 2) << 5) | (cr >> 3)
-                                if cur_bgr == sprite.transparent:
-                                    new_bgr = cur_bgr ^ 1
-                                    nb5 = (new_bgr >> 11) & 0x1F
-                                    ng6 = (new_bgr >> 5) & 0x3F
-                                    nr5 = new_bgr & 0x1F
-                                    pixels[sx, sy] = (
-                                        (nr5 << 3) | (nr5 >> 2),
-                                        (ng6 << 2) | (ng6 >> 4),
-                                        (nb5 << 3) | (nb5 >> 2))
+            # Work on the brush's bounding box only, clipped to the sprite
+            res = sprite.resolution
+            box = (max(0, center_x - radius), max(0, center_y - radius),
+                   min(res, center_x + radius + 1), min(res, center_y + radius + 1))
+            if box[0] >= box[2] or box[1] >= box[3]:
+                return
+            brush = brush_disk(radius)[box[1] - center_y + radius:box[3] - center_y + radius,
+                                       box[0] - center_x + radius:box[2] - center_x + radius]
+
+            # Fill the brushed pixels in place with a solid color through a mask, rather
+            # than round-tripping the patch through a new array and image each stroke
+            if edit_mode == 'erase':
+                trans_b = ((sprite.transparent >> 11) & 0x1F) << 3
+                trans_g = ((sprite.transparent >> 5) & 0x3F) << 2
+                trans_r = (sprite.transparent & 0x1F) << 3
+                color = (trans_r, trans_g, trans_b)
+            elif edit_mode == 'de_erase':
+                # Nudge transparent pixels to the nearest opaque BGR565 value
+                brush = brush & (rgb_to_bgr565_array(img_rgb.crop(box)).reshape(brush.shape)
+                                 == sprite.transparent)
+                color = tuple(_bgr565_rgb_table()[sprite.transparent ^ 1].tolist())
+            else:
+                return
+            mask = Image.fromarray(np.where(brush, 255, 0).astype(np.uint8), "L")
+            img_rgb.paste(color, box, mask)
 
-            update_canvas()
-            update_source_thumbnail()
+            schedule_redraw(update_canvas, update_source_thumbnail)
 
         def _do_fill_transparent(center_x, center_y):
             """Fill all pixels matching the clicked color with the transparent color."""
-            pixels = img_rgb.load()
-            r, g, b = pixels[center_x, center_y]
-            target_bgr565 = ((b >> 3) << 11) | ((g >> 2) << 5) | (r >> 3)
+            r, g, b = img_rgb.getpixel((center_x, center_y))
+            target_bgr565 = rgb_to_bgr565(r, g, b)
 
             if target_bgr565 == sprite.transparent:
                 status_label.config(text="That color is already the transparent color.",
@@ -3314,14 +3997,14 @@ class RayCast3DStudio:
             trans_g = ((sprite.transparent >> 5) & 0x3F) << 2
             trans_r = (sprite.transparent & 0x1F) << 3
 
-            count = 0
-            for py in range(sprite.resolution):
-                for px in range(sprite.resolution):
-                    pr, pg, pb = pixels[px, py]
-                    pixel_bgr = ((pb >> 3) << 11) | ((pg >> 2) << 5) | (pr >> 3)
-                    if pixel_bgr == target_bgr565:
-                        pixels[px, py] = (trans_r, trans_g, trans_b)
-                        count += 1
+            # Same BGR565 value == same quantized RGB, so mask the low bits and compare exactly
+            arr = np.array(img_rgb)
+            match = (((arr[..., 0] & 0xF8) == (r & 0xF8)) &
+                     ((arr[..., 1] & 0xFC) == (g & 0xFC)) &
+                     ((arr[..., 2] & 0xF8) == (b & 0xF8)))
+            arr[match] = (trans_r, trans_g, trans_b)
+            count = int(match.sum())
+            img_rgb.paste(Image.fromarray(arr, "RGB"))
 
             update_canvas()
             update_source_thumbnail()
@@ -3385,26 +4068,14 @@ class RayCast3DStudio:
 
         def save_and_close():
             """Commit all edits and close."""
-            pixels = img_rgb.load()
-            c_vals = []
-            for y in range(sprite.resolution):
-                for x in range(sprite.resolution):
-                    r, g, b = pixels[x, y]
-                    blue5 = b >> 3
-                    green6 = g >> 2
-                    red5 = r >> 3
-                    color = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
-                    c_vals.append(f"0x{color:04X}")
-
-            sprite.c_array = c_vals
-            sprite.preview = self._create_sprite_preview(
-                img_rgb, sprite.resolution, sprite.resolution, sprite.transparent)
+            sprite.c_array, preview_img = self._pack_sprite(img_rgb, sprite.resolution, sprite.transparent)
+            self._set_sprite_preview(sprite, preview_img)
 
-            self._refresh_sprite_list()
+            self._update_sprite_row(idx)
+            self.selected_sprite_rows = set()  # Reselect below instead of toggling the row off
             self._select_sprite_row(idx)
             self._update_memory_display()
-            self._auto_export()
-            self._save_project()
+            self._schedule_save()
             dialog.destroy()
 
         def discard_changes():
@@ -3418,64 +4089,94 @@ class RayCast3DStudio:
         ttk.Button(button_frame, text="Save & Close", command=save_and_close).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Discard", command=discard_changes).pack(side='left', padx=5)
 
-    def _create_sprite_preview_image(self, img_rgb, width, height, transparent_bgr565):
+    def _pack_sprite(self, img_rgb, resolution, transparent_bgr565):
+        """Pack a sprite's RGB image to BGR565 and build its preview from the same array.
+
+        Returns (c_array, preview PIL Image).
+        """
+        c_array = rgb_to_bgr565_array(img_rgb)
+        preview_img = self._create_sprite_preview_image(
+            img_rgb, resolution, resolution, transparent_bgr565, c_array)
+        return c_array, preview_img
+
+    def _create_sprite_preview_image(self, img_rgb, width, height, transparent_bgr565, packed=None):
         """
         Create a transparency-aware sprite preview PIL Image that simulates in-game appearance.
         Shows checkerboard pattern behind transparent pixels, scaled as it would appear in-game.
+        packed is img_rgb's flat BGR565 array, if the caller already has it.
         Returns PIL Image (not PhotoImage).
         """
-        # Simulate sprite at larger scale for better visibility
-        scale = max(2, 128 // height)
-        display_w = width * scale
-        display_h = height * scale
-
-        # Create checkerboard background
-        checker = create_checkerboard(display_w, display_h, cell_size=max(4, scale))
-
-        # Scale sprite with NEAREST to simulate in-game sampling
-        sprite_scaled = img_rgb.resize((display_w, display_h), Image.NEAREST)
-        sprite_pixels = sprite_scaled.load()
-
-        # Convert transparent color back to RGB for comparison
-        # BGR565: ((b>>3)<<11) | ((g>>2)<<5) | (r>>3)
-        trans_b = ((transparent_bgr565 >> 11) & 0x1F) << 3
-        trans_g = ((transparent_bgr565 >> 5) & 0x3F) << 2
-        trans_r = (transparent_bgr565 & 0x1F) << 3
-
-        # Composite: draw sprite pixels on checkerboard, skip transparent
-        checker_pixels = checker.load()
-        for y in range(display_h):
-            for x in range(display_w):
-                r, g, b = sprite_pixels[x, y]
-                # Check if this pixel matches transparent color EXACTLY (no tolerance - matches C code)
-                # Convert pixel to BGR565 and compare
-                pixel_bgr565 = ((b >> 3) << 11) | ((g >> 2) << 5) | (r >> 3)
-                if pixel_bgr565 == transparent_bgr565:
-                    # Transparent - leave checkerboard visible
-                    pass
-                else:
-                    # Opaque - draw sprite pixel
-                    checker_pixels[x, y] = (r, g, b)
-
-        return checker
-
-    def _create_sprite_preview(self, img_rgb, width, height, transparent_bgr565):
+        display_size, checker, composite_first = _sprite_preview_template(width, height)
+
+        # Transparent pixels match the transparent color EXACTLY in BGR565 (no tolerance - matches C code)
+        if packed is None:
+            packed = rgb_to_bgr565_array(img_rgb)
+        packed = packed.reshape(img_rgb.height, img_rgb.width)
+        mask = (packed == transparent_bgr565).view(np.uint8)  # 0/1 bytes, scaled to 0/255 in place
+        mask *= 255
+        transparent_mask = Image.fromarray(mask, "L")
+        if img_rgb.mode != "RGB":
+            img_rgb = img_rgb.convert("RGB")
+
+        if composite_first and img_rgb.size == (width, height):
+            # Every sprite pixel lies inside a single checker cell, so composite at sprite
+            # resolution and scale the result once with NEAREST to simulate in-game sampling
+            return Image.composite(checker, img_rgb, transparent_mask).resize(display_size, Image.NEAREST)
+
+        # Scale sprite and mask with the same NEAREST sampling, then composite at preview size
+        if composite_first:
+            checker = _display_checkerboard(width, height)
+        sprite_scaled = img_rgb.resize(display_size, Image.NEAREST)
+        transparent_mask = transparent_mask.resize(display_size, Image.NEAREST)
+
+        # Checkerboard where transparent, sprite pixels everywhere else; sprite_scaled is
+        # our own copy, so paste into it rather than allocating a composite image
+        sprite_scaled.paste(checker, (0, 0), transparent_mask)
+        return sprite_scaled
+
+    def _get_sprite_preview(self, sprite):
+        """Return the sprite's preview, building it from c_array on first use."""
+        if sprite.preview is None and len(sprite.c_array) == sprite.resolution * sprite.resolution:
+            try:
+                img_rgb = bgr565_array_to_image(sprite.c_array, sprite.resolution)
+                self._set_sprite_preview(sprite, self._create_sprite_preview_image(
+                    img_rgb, sprite.resolution, sprite.resolution, sprite.transparent, sprite.c_array))
+            except Exception as e:
+                print(f"Warning: could not create preview for sprite {sprite.name}: {e}")
+        return sprite.preview
+
+    def _set_sprite_preview(self, sprite, preview_img):
         """
-        Create a transparency-aware sprite preview that simulates in-game appearance.
-        Shows checkerboard pattern behind transparent pixels, scaled as it would appear in-game.
-        Returns PhotoImage for tkinter.
+        Set a sprite's preview from a PIL image (see _create_sprite_preview_image).
+        Pastes into the sprite's existing PhotoImage when the size matches, so each sprite
+        keeps one Tk image instead of allocating a new one per update.
         """
-        preview_img = self._create_sprite_preview_image(img_rgb, width, height, transparent_bgr565)
-        return ImageTk.PhotoImage(preview_img)
+        photo = sprite.preview
+        if photo is not None and (photo.width(), photo.height()) == preview_img.size:
+            photo.paste(preview_img)
+        else:
+            sprite.preview = ImageTk.PhotoImage(preview_img)
+        return sprite.preview
+
+    def _recount_memory(self):
+        """Recompute the running texture/sprite byte totals from scratch (after bulk loads)."""
+        self._tex_bytes = sum(t.memory_bytes() for t in self.textures)
+        self._sprite_bytes = sum(s.memory_bytes() for s in self.sprites)
 
     def _update_memory_display(self):
         """Update the memory usage display."""
-        tex_memory = sum(t.memory_bytes() for t in self.textures)
-        sprite_memory = sum(s.memory_bytes() for s in self.sprites)
+        tex_memory = self._tex_bytes
+        sprite_memory = self._sprite_bytes
         map_memory = MAP_SIZE * MAP_SIZE * len(self.maps)  # 1 byte per cell per map
         font_memory = 255 * 5 if self.font_data else 0  # 5 bytes per character
         total = tex_memory + sprite_memory + map_memory + font_memory
 
+        # Most callers (e.g. sprite edits) leave the totals as they were; skip re-laying out the labels
+        totals = (tex_memory, sprite_memory, map_memory, font_memory)
+        if totals == self._memory_totals:
+            return
+        self._memory_totals = totals
+
         self.memory_label.config(text=f"Memory Usage: {total:,} bytes")
         self.memory_detail.config(
             text=f"Tex: {tex_memory:,}  |  Spr: {sprite_memory:,}  |  Maps: {map_memory}  |  Font: {font_memory}"
@@ -3487,7 +4188,9 @@ class RayCast3DStudio:
         """Save project state to JSON file."""
         try:
             project = {
-                'maps': self.maps,  # List of {"name": str, "data": 2D list}
+                # List of {"name": str, "data": 2D list}; map grids are uint8 arrays in memory,
+                # which orjson serializes directly
+                'maps': list(self.maps) if orjson is not None else [dict(m, data=m["data"].tolist()) for m in self.maps],
                 'current_map_idx': self.current_map_idx,
                 'textures': [t.to_dict() for t in self.textures] + self._unloaded_textures,
                 'sprites': [s.to_dict() for s in self.sprites] + self._unloaded_sprites,
@@ -3497,13 +4200,78 @@ class RayCast3DStudio:
                 project['font_data'] = self.font_data
             if self.font_path:
                 project['font_path'] = self.font_path
-            with open(PROJECT_FILE, 'w') as f:
-                json.dump(project, f, indent=2)
+            data = project_json_dumps(project)
+            digest = hashlib.blake2b(data, digest_size=8).digest()
+            # Back-to-back saves (e.g. paint, release, paint again) often serialize the same state
+            if digest != self._project_digest or not os.path.exists(PROJECT_FILE):
+                # Write to a temp file and swap it in so a crash mid-save can't truncate the project
+                tmp_path = PROJECT_FILE + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, PROJECT_FILE)
+                self._project_digest = digest
+            self._save_sprite_cache()
             print(f"Saved: {len(self.textures)} textures, {len(self.sprites)} sprites, {len(self.maps)} maps, {len(self.colors)} colors")
         except Exception as e:
             print(f"Error saving project: {e}")
             messagebox.showerror("Save Error", f"Failed to save project: {e}")
 
+    def _save_sprite_cache(self):
+        """Write sprite pixel data to a binary sidecar so loading can skip parsing images.h.
+
+        Skipped when nothing that feeds images.h changed since the last write (map and color
+        edits), which keeps the sidecar at least as new as images.h.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        for s in self.sprites:
+            h.update(f"{s.name}:{s.transparent}\0".encode('utf-8'))
+            h.update(s.c_array.tobytes())
+        digest = h.digest()
+        if digest == self._sprite_cache_digest and os.path.exists(SPRITE_CACHE_FILE):
+            return
+
+        tmp_path = SPRITE_CACHE_FILE + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            # Arrays are stored positionally (arr_0, arr_1, ...) with their sprite names in a
+            # separate "names" entry: names are user-chosen, so they can't be savez() keywords
+            np.savez(f, *[s.c_array for s in self.sprites],
+                     names=np.array([s.name for s in self.sprites], dtype=str))
+        os.replace(tmp_path, SPRITE_CACHE_FILE)
+        self._sprite_cache_digest = digest
+
+    def _load_sprite_cache(self, sprite_dicts):
+        """Load sprite data from the binary sidecar, in the same form as _parse_images_h.
+
+        Returns None if there is no sidecar or images.h was written after it (e.g. edited by hand),
+        in which case images.h has to be parsed.
+        """
+        if not os.path.exists(SPRITE_CACHE_FILE):
+            return None
+        images_h_path = os.path.join(ASSETS_DIR, "images.h")
+        if os.path.exists(images_h_path) and os.path.getmtime(images_h_path) > os.path.getmtime(SPRITE_CACHE_FILE):
+            return None
+
+        sprite_data = {}
+        try:
+            with np.load(SPRITE_CACHE_FILE) as cache:
+                if 'names' not in cache.files:
+                    return None  # Older sidecar keyed by sprite name; rebuilt on the next save
+                index = {name: i for i, name in enumerate(cache['names'].tolist())}
+                for sd in sprite_dicts:
+                    name = sd.get('name')
+                    if name not in index:
+                        continue
+                    c_array = cache[f"arr_{index[name]}"].astype(np.uint16, copy=False)  # Already uint16 unless written by hand
+                    sprite_data[name] = {
+                        'c_array': c_array,
+                        'transparent': sd.get('transparent', 0x0000),
+                        'resolution': int(round(len(c_array) ** 0.5))
+                    }
+        except Exception as e:
+            print(f"Error reading sprite cache: {e}")
+            return None
+        return sprite_data
+
     def _parse_textures_h(self):
         """Parse textures.h to extract texture data (c_array, resolution)."""
         textures_h_path = os.path.join(ASSETS_DIR, "textures.h")
@@ -3512,43 +4280,15 @@ class RayCast3DStudio:
 
         texture_data = {}
         try:
-            import re
             with open(textures_h_path, 'r') as f:
-                lines = f.readlines()
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Look for texture comment: // NAME (RESxRES)
-                comment_match = re.match(r'//\s*(\w+)\s*\((\d+)x(\d+)\)', line)
-                if comment_match:
-                    name = comment_match.group(1)
-                    res = int(comment_match.group(2))
-
-                    # Find the data array
-                    i += 1
-                    data_array = []
-                    while i < len(lines):
-                        line = lines[i].strip()
-                        if line.startswith('static const uint16_t') and '_data[' in line:
-                            i += 1
-                            while i < len(lines):
-                                line = lines[i].strip()
-                                if line == '};':
-                                    break
-                                hex_values = re.findall(r'0x[0-9A-Fa-f]+', line, re.IGNORECASE)
-                                data_array.extend([val.upper() for val in hex_values])
-                                i += 1
-                            break
-                        i += 1
-
-                    if data_array:
-                        texture_data[name] = {
-                            'c_array': data_array,
-                            'resolution': res
-                        }
-                i += 1
+                text = f.read()
+
+            for comment, digits in scan_header_arrays(text, TEXTURE_COMMENT_RE):
+                if digits:
+                    texture_data[comment.group(1)] = {
+                        'c_array': hex16_to_array(digits),
+                        'resolution': int(comment.group(2))
+                    }
         except Exception as e:
             print(f"Error parsing textures.h: {e}")
             import traceback
@@ -3559,29 +4299,13 @@ class RayCast3DStudio:
     def _create_texture_previews_from_array(self, tex):
         """Create texture previews from BGR565 c_array data (no source image needed)."""
         try:
-            res = tex.resolution
-            img_rgb = Image.new("RGB", (res, res))
-            pixels = img_rgb.load()
-
-            for i, hex_val in enumerate(tex.c_array):
-                bgr565 = int(hex_val, 16)
-                blue5 = (bgr565 >> 11) & 0x1F
-                green6 = (bgr565 >> 5) & 0x3F
-                red5 = bgr565 & 0x1F
-
-                r = (red5 << 3) | (red5 >> 2)
-                g = (green6 << 2) | (green6 >> 4)
-                b = (blue5 << 3) | (blue5 >> 2)
-
-                x = i % res
-                y = i // res
-                pixels[x, y] = (r, g, b)
+            img_rgb = bgr565_array_to_image(tex.c_array, tex.resolution)
 
             tex.pil_image = img_rgb
-            tex.preview = self._create_wall_preview(img_rgb, res)
+            tex.preview = None  # Built on demand by _get_texture_preview
 
             tile = img_rgb.resize((CELL_SIZE, CELL_SIZE), Image.NEAREST)
-            tex.tile_preview = ImageTk.PhotoImage(tile)
+            self._set_texture_tile(tex, tile)
         except Exception as e:
             print(f"Error creating previews from array for {tex.name}: {e}")
 
@@ -3593,58 +4317,16 @@ class RayCast3DStudio:
         
         sprite_data = {}
         try:
-            import re
             with open(images_h_path, 'r') as f:
-                lines = f.readlines()
-            
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                
-                # Look for sprite comment: // NAME (RESxRES, transparent=0xXXXX)
-                comment_match = re.match(r'//\s*(\w+)\s*\((\d+)x(\d+),\s*transparent=0x([0-9A-Fa-f]+)\)', line)
-                if comment_match:
-                    name = comment_match.group(1)
-                    res = int(comment_match.group(2))
-                    transparent_hex = comment_match.group(4)
-                    
-                    # Find the data array
-                    i += 1
-                    data_array = []
-                    while i < len(lines):
-                        line = lines[i].strip()
-                        if line.startswith('static const uint16_t') and '_data[' in line:
-                            # Found data array start
-                            i += 1
-                            # Collect all hex values until closing brace
-                            while i < len(lines):
-                                line = lines[i].strip()
-                                if line == '};':
-                                    break
-                                # Extract hex values from this line
-                                hex_values = re.findall(r'0x[0-9A-Fa-f]+', line, re.IGNORECASE)
-                                data_array.extend([val.upper() for val in hex_values])
-                                i += 1
-                            break
-                        i += 1
-                    
-                    # Find the SpriteImage struct to verify transparent color
-                    while i < len(lines):
-                        line = lines[i].strip()
-                        sprite_match = re.match(r'(?:static\s+)?const SpriteImage\s+' + re.escape(name) + r'\s*=\s*\{[^,]+,\s*(\d+),\s*(\d+),\s*0x([0-9A-Fa-f]+)\}', line)
-                        if sprite_match:
-                            # Use transparent from struct (more reliable)
-                            transparent = int(sprite_match.group(3), 16)
-                            break
-                        i += 1
-                    
-                    if data_array:
-                        sprite_data[name] = {
-                            'c_array': data_array,
-                            'transparent': int(transparent_hex, 16),
-                            'resolution': res
-                        }
-                i += 1
+                text = f.read()
+
+            for comment, digits in scan_header_arrays(text, SPRITE_COMMENT_RE):
+                if digits:
+                    sprite_data[comment.group(1)] = {
+                        'c_array': hex16_to_array(digits),
+                        'transparent': int(comment.group(4), 16),
+                        'resolution': int(comment.group(2))
+                    }
         except Exception as e:
             print(f"Error parsing images.h: {e}")
             import traceback
@@ -3652,6 +4334,29 @@ class RayCast3DStudio:
         
         return sprite_data
 
+    @staticmethod
+    def _source_file_checker(paths):
+        """Return an exists(path) function backed by one os.scandir() per distinct parent folder."""
+        listings = {}
+        for path in paths:
+            folder = os.path.dirname(path)
+            if folder in listings:
+                continue
+            try:
+                with os.scandir(folder or '.') as entries:
+                    listings[folder] = {e.name for e in entries}
+            except OSError:
+                listings[folder] = set()
+
+        def exists(path):
+            names = listings.get(os.path.dirname(path))
+            if names is not None and os.path.basename(path) in names:
+                return True
+            # Not in the listing (or not pre-scanned): confirm with a stat, e.g. for case-insensitive filesystems
+            return os.path.exists(path)
+
+        return exists
+
     def _load_project(self):
         """Load project state from JSON file."""
         if not os.path.exists(PROJECT_FILE):
@@ -3662,20 +4367,41 @@ class RayCast3DStudio:
         try:
             # Parse exported .h files to recover data when source images are missing
             exported_textures = self._parse_textures_h()
-            exported_sprites = self._parse_images_h()
-            
-            with open(PROJECT_FILE, 'r') as f:
-                project = json.load(f)
+
+            with open(PROJECT_FILE, 'rb') as f:
+                project = project_json_loads(f.read())
+
+            # One directory listing per source folder instead of a stat per texture/sprite
+            source_exists = self._source_file_checker(
+                [d.get('image_path', '') for d in project.get('textures', []) + project.get('sprites', [])])
+
+            # Decode texture sources on the worker pool while the rest of the project is parsed
+            texture_jobs = [self._io_pool.submit(load_texture_images, td['image_path'], td['resolution'])
+                            if source_exists(td.get('image_path', '')) else None
+                            for td in project.get('textures', [])]
+
+            # Sprite pixel data: binary sidecar when it is current, otherwise parse images.h
+            exported_sprites = self._load_sprite_cache(project.get('sprites', []))
+            if exported_sprites is None:
+                exported_sprites = self._parse_images_h()
+
+            # Sprites missing from the export are rebuilt from their sources, also on the pool
+            sprites = [Sprite.from_dict(sd) for sd in project.get('sprites', [])]
+            sprite_jobs = [self._io_pool.submit(self._convert_sprite_source, sprite.image_path, sprite.resolution)
+                           if sprite.name not in exported_sprites and source_exists(sprite.image_path) else None
+                           for sprite in sprites]
 
             # Load maps (new format: multiple maps)
             if 'maps' in project:
                 self.maps = project['maps']
+                for m in self.maps:
+                    m["data"] = np.array(m["data"], dtype=np.uint8)
                 self.current_map_idx = project.get('current_map_idx', 0)
                 # Ensure index is valid
                 self.current_map_idx = min(self.current_map_idx, len(self.maps) - 1)
             # Backwards compatibility: load old single map format
             elif 'map_data' in project:
-                self.maps = [{"name": "map1", "data": project['map_data']}]
+                self.maps = [{"name": "map1", "data": np.array(project['map_data'], dtype=np.uint8)}]
                 self.current_map_idx = 0
 
             # Update map selector if it exists
@@ -3684,11 +4410,11 @@ class RayCast3DStudio:
 
             # Load textures
             if 'textures' in project:
-                for td in project['textures']:
+                for td, job in zip(project['textures'], texture_jobs):
                     tex = Texture.from_dict(td)
-                    if os.path.exists(tex.image_path):
+                    if job is not None:
                         try:
-                            self._create_texture_previews(tex)
+                            self._create_texture_previews(tex, job.result())
                         except Exception as e:
                             print(f"Warning: could not create preview for texture {tex.name}: {e}")
                         tex.index = len(self.textures) + 1
@@ -3710,9 +4436,7 @@ class RayCast3DStudio:
 
             # Load sprites
             if 'sprites' in project:
-                for sd in project['sprites']:
-                    sprite = Sprite.from_dict(sd)
-                    
+                for sd, sprite, job in zip(project['sprites'], sprites, sprite_jobs):
                     # Check if sprite exists in exported images.h (has edits)
                     if sprite.name in exported_sprites:
                         # Load from exported data (preserves edits)
@@ -3721,61 +4445,14 @@ class RayCast3DStudio:
                         sprite.transparent = exported['transparent']
                         sprite.resolution = exported['resolution']
 
-                        # Reconstruct RGB image from c_array for preview
-                        # We need to create an image from the BGR565 data
-                        img_rgb = Image.new("RGB", (sprite.resolution, sprite.resolution))
-                        pixels = img_rgb.load()
-
-                        for i, hex_val in enumerate(sprite.c_array):
-                            bgr565 = int(hex_val, 16)
-                            # Convert BGR565 to RGB
-                            blue5 = (bgr565 >> 11) & 0x1F
-                            green6 = (bgr565 >> 5) & 0x3F
-                            red5 = bgr565 & 0x1F
-
-                            r = (red5 << 3) | (red5 >> 2)
-                            g = (green6 << 2) | (green6 >> 4)
-                            b = (blue5 << 3) | (blue5 >> 2)
-
-                            x = i % sprite.resolution
-                            y = i // sprite.resolution
-                            pixels[x, y] = (r, g, b)
-
-                        # Create preview from reconstructed image
-                        try:
-                            sprite.preview = self._create_sprite_preview(img_rgb, sprite.resolution, sprite.resolution, sprite.transparent)
-                        except Exception as e:
-                            print(f"Warning: could not create preview for sprite {sprite.name}: {e}")
-                            sprite.preview = None
+                        # Preview is rebuilt from c_array on first selection (_get_sprite_preview)
+                        sprite.preview = None
 
                         self.sprites.append(sprite)
-                    elif os.path.exists(sprite.image_path):
-                        # Sprite not in images.h - load from original image (new sprite)
-                        img = Image.open(sprite.image_path)
-                        res = sprite.resolution
-
-                        # Re-detect transparent color and get processed image
-                        transparent, img_rgb = self._detect_transparent_color(img, res, res)
-                        sprite.transparent = transparent
-                        pixels = img_rgb.load()
-
-                        c_vals = []
-                        for y in range(res):
-                            for x in range(res):
-                                r, g, b = pixels[x, y]
-                                blue5 = b >> 3
-                                green6 = g >> 2
-                                red5 = r >> 3
-                                color = ((blue5 & 0x1F) << 11) | ((green6 & 0x3F) << 5) | (red5 & 0x1F)
-                                c_vals.append(f"0x{color:04X}")
-                        sprite.c_array = c_vals
-
-                        # Transparency-aware preview with checkerboard background
-                        try:
-                            sprite.preview = self._create_sprite_preview(img_rgb, res, res, sprite.transparent)
-                        except Exception as e:
-                            print(f"Warning: could not create preview for sprite {sprite.name}: {e}")
-                            sprite.preview = None
+                    elif job is not None:
+                        # Sprite not in images.h - converted from original image (new sprite)
+                        sprite.transparent, sprite.c_array = job.result()
+                        sprite.preview = None  # Built on first selection
 
                         self.sprites.append(sprite)
                     else:
@@ -3796,12 +4473,13 @@ class RayCast3DStudio:
                 self.font_info_label.config(text=f"Font: {os.path.basename(self.font_path)} (5x8)")
 
             # Update UI
-            self._refresh_texture_list()
-            self._update_texture_palette()
-            self._refresh_sprite_list()
-            self._refresh_color_list()
-            self._refresh_font_grid()
-            self._draw_map_grid()
+            with self._deferred_list_layout():
+                self._refresh_texture_list()
+                self._update_texture_palette()
+                self._refresh_sprite_list()
+                self._refresh_color_list()
+                self._refresh_font_grid()
+                self._draw_map_grid()
 
             # Warn about missing files
             if missing_files:
@@ -3825,84 +4503,132 @@ class RayCast3DStudio:
         if not self.auto_export_enabled:
             return
 
-        os.makedirs(ASSETS_DIR, exist_ok=True)
+        if not self._assets_dir_ready:
+            os.makedirs(ASSETS_DIR, exist_ok=True)
+            self._assets_dir_ready = True
 
         try:
+            # Headers are generated here, but each file write runs on the export worker so it
+            # overlaps with generating the next header
+            writes = []
+
             # Export textures.h (skip if we'd overwrite data with an empty file)
             if self.textures or not self._unloaded_textures:
-                content = self._generate_textures_h()
-                with open(os.path.join(ASSETS_DIR, "textures.h"), 'w') as f:
-                    f.write(content)
+                writes.append(self._export_pool.submit(self._write_export, "textures.h", self._generate_textures_h()))
 
             # Export maps.h
-            content = self._generate_maps_h()
-            with open(os.path.join(ASSETS_DIR, "maps.h"), 'w') as f:
-                f.write(content)
+            writes.append(self._export_pool.submit(self._write_export, "maps.h", self._generate_maps_h()))
 
             # Export images.h (skip if we'd overwrite data with an empty file)
             if self.sprites or not self._unloaded_sprites:
-                content = self._generate_images_h()
-                with open(os.path.join(ASSETS_DIR, "images.h"), 'w') as f:
-                    f.write(content)
+                writes.append(self._export_pool.submit(self._write_export, "images.h", self._generate_images_h()))
 
             # Export colors.h
-            content = self._generate_colors_h()
-            with open(os.path.join(ASSETS_DIR, "colors.h"), 'w') as f:
-                f.write(content)
+            writes.append(self._export_pool.submit(self._write_export, "colors.h", self._generate_colors_h()))
 
             # Export font.h (only if font data has been initialized)
             if self.font_data is not None:
-                content = self._generate_font_h()
-                with open(os.path.join(ASSETS_DIR, "font.h"), 'w') as f:
-                    f.write(content)
+                writes.append(self._export_pool.submit(self._write_export, "font.h", self._generate_font_h()))
+
+            # Wait for every write; result() re-raises a failed write here
+            for write in writes:
+                write.result()
 
             self.status_label.config(text="Auto-saved to assets/", foreground='green')
         except Exception as e:
+            self._assets_dir_ready = False  # Re-create assets/ next time in case it was removed
             self.status_label.config(text=f"Export error: {e}", foreground='red')
 
+    def _write_export(self, filename, content):
+        """Atomically write an exported header, skipping the write if its content is unchanged.
+
+        Runs on the export worker (see _auto_export), so no Tk calls here.
+        """
+        path = os.path.join(ASSETS_DIR, filename)
+        # Compare the text itself: a string compare is cheaper than encoding and hashing
+        # megabytes of unchanged header on every export
+        previous = self._export_contents.get(filename)
+        if previous is None:
+            # First export this session: compare with the file on disk, so reopening the
+            # studio doesn't rewrite (and bump the mtime of, forcing a rebuild) current headers.
+            # Text mode reads platform line endings back as '\n', like content uses
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    previous = f.read()
+            except (OSError, UnicodeDecodeError):
+                previous = None
+            self._export_contents[filename] = previous
+        if previous == content and os.path.exists(path):
+            return
+
+        # Keep the platform's line endings, as text-mode writes did (CRLF on Windows)
+        data = (content if os.linesep == '\n' else content.replace('\n', os.linesep)).encode('utf-8')
+        tmp_path = path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+        self._export_contents[filename] = content
+
+    @staticmethod
+    def _formatted_rows(values, resolution, cache, used):
+        """Return values formatted by write_bgr565_rows, reusing the text from the last export.
+
+        Pixel arrays are replaced rather than modified in place, so an entry whose array is
+        the same object still matches. Entries looked up are copied into used, which becomes
+        the cache for the next export so removed textures and sprites drop out.
+        """
+        entry = cache.get(id(values))
+        if entry is None or entry[0] is not values or entry[1] != resolution:
+            buf = io.StringIO()
+            write_bgr565_rows(buf, values, resolution)
+            entry = (values, resolution, buf.getvalue())
+        used[id(values)] = entry
+        return entry[2]
+
     def _generate_textures_h(self):
         """Generate textures.h content with per-texture resolution support."""
-        lines = [
-            "#ifndef TEXTURES_H_",
-            "#define TEXTURES_H_",
-            "",
-            "#include <stdint.h>",
-            "#include \"../services/graphics.h\"  // For TextureInfo struct",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write("#ifndef TEXTURES_H_\n"
+                  "#define TEXTURES_H_\n"
+                  "\n"
+                  "#include <stdint.h>\n"
+                  "#include \"../services/graphics.h\"  // For TextureInfo struct\n"
+                  "\n")
 
         if self.textures:
-            lines.append(f"#define NUM_TEXTURES {len(self.textures)}")
-            lines.append("")
+            buf.write(f"#define NUM_TEXTURES {len(self.textures)}\n\n")
 
         # Generate texture data arrays (row-major order)
+        rows_cache = self._export_rows_cache.get("textures.h", {})
+        used_rows = {}
         for tex in self.textures:
-            lines.append(f"// {tex.name} ({tex.resolution}x{tex.resolution})")
-            lines.append(f"static const uint16_t {tex.name}_data[{tex.resolution} * {tex.resolution}] = {{")
+            buf.write(f"// {tex.name} ({tex.resolution}x{tex.resolution})\n")
+            buf.write(f"static const uint16_t {tex.name}_data[{tex.resolution} * {tex.resolution}] = {{\n")
 
             # Format array in rows
-            row_size = tex.resolution
-            for i in range(0, len(tex.c_array), row_size):
-                row = tex.c_array[i:i+row_size]
-                lines.append("    " + ", ".join(row) + ",")
+            buf.write(self._formatted_rows(tex.c_array, tex.resolution, rows_cache, used_rows))
 
-            lines.append("};")
-            lines.append("")
+            buf.write("};\n\n")
+        self._export_rows_cache["textures.h"] = used_rows
 
         # Generate TextureInfo array with per-texture resolution
         if self.textures:
-            lines.append("// Texture lookup array with per-texture resolution")
-            lines.append("// Map value 1 -> textures[0], value 2 -> textures[1], etc.")
-            lines.append("const TextureInfo textures[] = {")
+            buf.write("// Texture lookup array with per-texture resolution\n"
+                      "// Map value 1 -> textures[0], value 2 -> textures[1], etc.\n"
+                      "const TextureInfo textures[] = {\n")
             for tex in self.textures:
                 mask = tex.resolution - 1  # Precomputed mask for power-of-2 textures
-                lines.append(f"    {{{tex.name}_data, {tex.resolution}, {mask}}},  // {tex.name}")
-            lines.append("};")
-            lines.append("")
+                buf.write(f"    {{{tex.name}_data, {tex.resolution}, {mask}}},  // {tex.name}\n")
+            buf.write("};\n\n")
 
-        lines.append("#endif /* TEXTURES_H_ */")
+        buf.write("#endif /* TEXTURES_H_ */")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _generate_maps_h(self):
         """Generate maps.h content with all maps and pointer array."""
@@ -3917,14 +4643,24 @@ class RayCast3DStudio:
         ]
 
         # Export each map grid with _grid suffix
+        # One template covering the whole grid, so each map is a single % over its flattened cells
+        row_fmt = "    {" + ",".join(["%d"] * MAP_SIZE) + "},"
+        grid_fmt = "\n".join([row_fmt] * MAP_SIZE)
+        # Grids are painted in place, so reuse last export's text by content rather than identity
+        grids_cache = self._export_rows_cache.get("maps.h", {})
+        used_grids = {}
         for map_info in self.maps:
             map_name = map_info["name"]
-            map_data = map_info["data"]
+            key = map_info["data"].tobytes()
+            grid_text = grids_cache.get(key)
+            if grid_text is None:
+                grid_text = grid_fmt % tuple(map_info["data"].ravel().tolist())
+            used_grids[key] = grid_text
             lines.append(f"static const uint8_t {map_name}_grid[{MAP_SIZE}][{MAP_SIZE}] = {{")
-            for row in map_data:
-                lines.append("    {" + ",".join(str(v) for v in row) + "},")
+            lines.append(grid_text)
             lines.append("};")
             lines.append("")
+        self._export_rows_cache["maps.h"] = used_grids
 
         # Export MapInfo descriptors (grid + floor/ceiling textures)
         for map_info in self.maps:
@@ -3951,7 +4687,8 @@ class RayCast3DStudio:
 
     def _generate_images_h(self):
         """Generate images.h content with SpriteImage struct for easy dimension access."""
-        lines = [
+        buf = io.StringIO()
+        header = [
             "#ifndef IMAGES_H_",
             "#define IMAGES_H_",
             "",
@@ -3974,30 +4711,28 @@ class RayCast3DStudio:
             "    Graphics_ForegroundSprite((sprite).data, x, y, (sprite).width, (sprite).height, scale, (sprite).transparent)",
             "",
         ]
+        buf.write("\n".join(header) + "\n")
 
         # Generate sprite data arrays and SpriteImage structs
+        rows_cache = self._export_rows_cache.get("images.h", {})
+        used_rows = {}
         for sprite in self.sprites:
             data_name = f"{sprite.name}_data"
             res = sprite.resolution
 
             # Raw pixel data (static to keep internal)
-            lines.append(f"// {sprite.name} ({res}x{res}, transparent=0x{sprite.transparent:04X})")
-            lines.append(f"static const uint16_t {data_name}[{res} * {res}] = {{")
-
-            row_size = res
-            for i in range(0, len(sprite.c_array), row_size):
-                row = sprite.c_array[i:i+row_size]
-                lines.append("    " + ", ".join(row) + ",")
-
-            lines.append("};")
+            buf.write(f"// {sprite.name} ({res}x{res}, transparent=0x{sprite.transparent:04X})\n")
+            buf.write(f"static const uint16_t {data_name}[{res} * {res}] = {{\n")
+            buf.write(self._formatted_rows(sprite.c_array, res, rows_cache, used_rows))
+            buf.write("};\n")
 
             # SpriteImage struct with embedded dimensions and transparent color
-            lines.append(f"static const SpriteImage {sprite.name} = {{{data_name}, {res}, {res}, 0x{sprite.transparent:04X}}};")
-            lines.append("")
+            buf.write(f"static const SpriteImage {sprite.name} = {{{data_name}, {res}, {res}, 0x{sprite.transparent:04X}}};\n\n")
+        self._export_rows_cache["images.h"] = used_rows
 
-        lines.append("#endif /* IMAGES_H_ */")
+        buf.write("#endif /* IMAGES_H_ */")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _generate_colors_h(self):
         """Generate colors.h content with BGR565 color constants."""